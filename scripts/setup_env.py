@@ -6,6 +6,7 @@ This script helps you set up the environment configuration for the pipeline.
 Run this script to interactively create your .env file.
 """
 
+import importlib.util
 import os
 import shutil
 from pathlib import Path
@@ -107,17 +108,23 @@ def check_requirements():
     
     print("\n🔍 Checking requirements...")
     
-    required_packages = [
-        'requests', 'pandas', 'PyGithub', 'openpyxl', 'python-dotenv'
-    ]
+    # Distribution name -> importable module name
+    required_packages = {
+        'requests': 'requests',
+        'pandas': 'pandas',
+        'PyGithub': 'github',
+        'openpyxl': 'openpyxl',
+        'python-dotenv': 'dotenv',
+    }
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_').replace('PyGithub', 'github'))
+    # find_spec locates each module without executing it, so the check
+    # does not pay the import cost of pandas/PyGithub
+    for package, module in required_packages.items():
+        if importlib.util.find_spec(module) is not None:
             print(f"   ✅ {package}")
-        except ImportError:
+        else:
             print(f"   ❌ {package}")
             missing_packages.append(package)
     
@@ -12,25 +12,85 @@ Version: 1.1.0 (Optimized)
 import os
 import sys
 import json
-from datetime import datetime
+import importlib
+import time
+from datetime import timedelta
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 
-# Add parent directory to path for module imports
-sys.path.insert(0, str(Path(__file__).parent))
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
 
-# Import modular components
-from scanners.code_scanning_scanner import CodeScanningScanner
-from reporters.code_scanning_report_generator import CodeScanningReportGenerator
-from utils.config_loader import load_config, validate_config, get_active_scope, get_scope_repositories
-from utils.logger import setup_logger
+try:
+    from tqdm import tqdm
+except ImportError:  # Optional progress bar; periodic log lines are used otherwise
+    tqdm = None
+
+# Import modular components (scanner and report generator are loaded on first use,
+# see _load_component, so pandas/openpyxl are not imported for runs that never report)
+if __package__:
+    # Imported as part of the src package (python -m src.code_scanning_pipeline)
+    from .utils.config_loader import load_config, validate_config, parse_config, Config, get_active_scope, get_scope_repositories
+    from .utils.github_env import read_github_env
+    from .utils.logger import setup_logger
+else:
+    # Run as a script; run_code_scanning.py has already put src/ on the path
+    _src_dir = str(Path(__file__).parent)
+    if _src_dir not in sys.path:
+        sys.path.insert(0, _src_dir)
+    from utils.config_loader import load_config, validate_config, parse_config, Config, get_active_scope, get_scope_repositories
+    from utils.github_env import read_github_env
+    from utils.logger import setup_logger
 
 # Load environment variables from .env file (in project root)
 project_root = Path(__file__).parent.parent
 env_path = project_root / ".env"
 load_dotenv(dotenv_path=env_path if env_path.exists() else None)
 
+# GitHub settings, read once now that .env is loaded
+_ENV = read_github_env('BGSW', 'https://github.boschdevcloud.com')
+
+
+def _load_component(module_name: str, class_name: str):
+    """Import a pipeline component class on demand, in either import mode."""
+    if __package__:
+        module = importlib.import_module(f".{module_name}", __package__)
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime: float) -> Mapping:
+    """
+    Parse a config file once per (path, mtime) pair.
+    
+    The result is shared between pipeline instances, so it is returned as a
+    read-only view. Editing the file changes its mtime and forces a re-read.
+    """
+    with open(config_path, 'rb') as f:
+        raw = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+    return MappingProxyType(orjson.loads(raw) if orjson is not None else json.loads(raw))
+
+
+# Default number of repositories scanned concurrently (override with scan.max_workers)
+DEFAULT_SCAN_WORKERS = 8
+
+# Section separator used in console output
+_HR = '=' * 60
+
+# Without tqdm, log scan progress every this many repositories
+PROGRESS_LOG_INTERVAL = 25
+
+logger = setup_logger('code_scanning_pipeline')
+
 
 class CodeScanningPipeline:
     """
@@ -57,16 +117,19 @@ class CodeScanningPipeline:
         else:
             self.config_path = config_path
         self.config = self._load_config()
+        self._config = self._parse_config()
+        self._scope_index = self._config.scopes
+        self._valid_scope_names = frozenset(self._scope_index)
         self.scanner = None
         self.report_generator = None
         self.temp_files = []
         self.reports_directory = None
     
-    def _load_config(self) -> Dict:
+    def _load_config(self) -> Mapping:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_path, 'r') as f:
-                config = json.load(f)
+            config_path = os.path.abspath(self.config_path)
+            config = _load_config_cached(config_path, os.path.getmtime(config_path))
             print(f"✅ Configuration loaded from: {self.config_path}")
             return config
         except FileNotFoundError:
@@ -79,8 +142,7 @@ class CodeScanningPipeline:
     def _validate_config(self) -> bool:
         """Validate required configuration parameters."""
         # Check for environment variables (primary method)
-        github_token = os.getenv('GITHUB_TOKEN')
-        if not github_token:
+        if not _ENV.github_token:
             print("❌ Error: GITHUB_TOKEN environment variable not set")
             print("💡 Please set it in your .env file or environment")
             return False
@@ -92,35 +154,35 @@ class CodeScanningPipeline:
         
         return True
     
+    def _parse_config(self) -> Config:
+        """Validate the loaded configuration once (scopes normalized to name -> repositories)."""
+        try:
+            return parse_config(self.config)
+        except ValueError as e:
+            print(f"❌ Invalid configuration: {e}")
+            sys.exit(1)
+    
+    @cached_property
+    def _all_repositories(self) -> List[str]:
+        """Deduplicated union of the repositories of every scope, in config order."""
+        return list(dict.fromkeys(chain.from_iterable(self._scope_index.values())))
+    
     def _get_scope_info(self, scope_name: str) -> Optional[Dict]:
         """Get scope configuration by name."""
-        # Support both dict format {"scope_name": [...]} and array format [{"name": "...", "repositories": [...]}]
-        if isinstance(self.config['scopes'], dict):
-            if scope_name in self.config['scopes']:
-                return {'name': scope_name, 'repositories': self.config['scopes'][scope_name]}
-            return None
-        else:
-            for scope in self.config['scopes']:
-                if scope['name'] == scope_name:
-                    return scope
-            return None
+        if scope_name in self._scope_index:
+            return {'name': scope_name, 'repositories': self._scope_index[scope_name]}
+        return None
     
     def _display_available_scopes(self):
         """Display all available scopes."""
         print("\n📋 Available Scopes:")
         print("-" * 60)
         
-        # Support both dict format and array format
-        if isinstance(self.config['scopes'], dict):
-            for idx, (scope_name, repos) in enumerate(self.config['scopes'].items(), 1):
-                print(f"{idx}. {scope_name}")
-                print(f"   Repositories: {len(repos)}")
-                print()
-        else:
-            for idx, scope in enumerate(self.config['scopes'], 1):
-                print(f"{idx}. {scope['name']}")
-                print(f"   Description: {scope.get('description', 'N/A')}")
-            print(f"   Repositories: {len(scope['repositories'])}")
+        for idx, (name, repositories) in enumerate(self._scope_index.items(), 1):
+            print(f"{idx}. {name}")
+            if name in self._config.scope_descriptions:
+                print(f"   Description: {self._config.scope_descriptions[name]}")
+            print(f"   Repositories: {len(repositories)}")
             print()
     
     def select_scope(self, scope_name: Optional[str] = None) -> Tuple[str, List[str]]:
@@ -136,8 +198,8 @@ class CodeScanningPipeline:
         """
         # If "scoped" is provided, use active_scope from config
         if scope_name and scope_name.lower() == "scoped":
-            if 'scan' in self.config and 'active_scope' in self.config['scan']:
-                scope_name = self.config['scan']['active_scope']
+            if self._config.scan.active_scope:
+                scope_name = self._config.scan.active_scope
                 print(f"ℹ️  Using active scope from config: {scope_name}")
             else:
                 print("❌ No active_scope defined in config.json")
@@ -145,8 +207,7 @@ class CodeScanningPipeline:
                 sys.exit(1)
         
         if scope_name:
-            scope = self._get_scope_info(scope_name)
-            if not scope:
+            if scope_name not in self._valid_scope_names:
                 print(f"❌ Scope '{scope_name}' not found in configuration")
                 self._display_available_scopes()
                 sys.exit(1)
@@ -156,21 +217,13 @@ class CodeScanningPipeline:
             scope_name = input("Scope: ").strip()
             
             if scope_name.lower() == 'all':
-                all_repos = []
-                if isinstance(self.config['scopes'], dict):
-                    for repos in self.config['scopes'].values():
-                        all_repos.extend(repos)
-                else:
-                    for scope in self.config['scopes']:
-                        all_repos.extend(scope['repositories'])
-                return "All Repositories", list(set(all_repos))
+                return "All Repositories", self._all_repositories
             
-            scope = self._get_scope_info(scope_name)
-            if not scope:
+            if scope_name not in self._valid_scope_names:
                 print(f"❌ Invalid scope: {scope_name}")
                 sys.exit(1)
         
-        return scope_name, scope['repositories']
+        return scope_name, self._scope_index[scope_name]
     
     def run_scan(self, scope_name: str, repositories: List[str]) -> Tuple[str, str, str]:
         """
@@ -183,59 +236,75 @@ class CodeScanningPipeline:
         Returns:
             Tuple of (json_file, csv_file, metadata_file) paths
         """
-        print(f"\n{'='*60}")
+        print(f"\n{_HR}")
         print(f"🔍 CODE SCANNING SCAN")
         print(f"Scope: {scope_name}")
         print(f"Repositories: {len(repositories)}")
-        print(f"{'='*60}\n")
+        print(f"{_HR}\n")
         
         # Initialize scanner using environment variables
-        github_token = os.getenv('GITHUB_TOKEN')
-        base_url = os.getenv('GITHUB_ENTERPRISE_URL', 'https://github.boschdevcloud.com')
-        org_name = os.getenv('GITHUB_ORG', 'BGSW')
+        org_name = _ENV.org_name
         
+        CodeScanningScanner = _load_component('scanners.code_scanning_scanner', 'CodeScanningScanner')
         self.scanner = CodeScanningScanner(
-            github_token=github_token,
-            base_url=base_url
+            github_token=_ENV.github_token,
+            base_url=_ENV.enterprise_url
         )
         
-        # Scan repositories
-        all_alerts = []
-        
-        for i, repo in enumerate(repositories, 1):
-            print(f"[{i}/{len(repositories)}] Processing {repo}...")
-            alerts = self.scanner.get_repository_code_scanning_alerts(org_name, repo)
+        # Scan repositories, streaming each repository's alerts straight to disk
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        with self.scanner.open_results_writer(timestamp) as writer:
+            # Track temp files for cleanup (also covers partially written files)
+            self.temp_files.extend([writer.json_filename, writer.csv_filename])
             
-            if alerts:
-                print(f"✅ Found {len(alerts)} Code Scanning alert(s)")
-            else:
-                print(f"⚠️  No Code Scanning alerts found")
+            # The scanner overlaps repository requests on its bounded pool (or reads
+            # the organization-level listing) and yields alerts in repository order
+            max_workers = self._config.scan.max_workers or DEFAULT_SCAN_WORKERS
             
-            all_alerts.extend(alerts)
-        
-        # Print scan summary
-        print(f"\n{'='*60}")
-        print(f"📊 SCAN SUMMARY")
-        print(f"{'='*60}")
-        print(f"Total repositories scanned: {len(repositories)}")
-        print(f"Total Code Scanning alerts found: {len(all_alerts)}")
-        
-        # Count by state
-        open_count = sum(1 for a in all_alerts if a.get('alert_state') == 'open')
-        fixed_count = sum(1 for a in all_alerts if a.get('alert_state') == 'fixed')
-        dismissed_count = sum(1 for a in all_alerts if a.get('alert_state') == 'dismissed')
-        
-        print(f"  • Open alerts: {open_count}")
-        print(f"  • Fixed alerts: {fixed_count}")
-        print(f"  • Dismissed alerts: {dismissed_count}")
-        print(f"{'='*60}\n")
-        
-        # Save results with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        json_file, csv_file, metadata_file = self.scanner.save_results(all_alerts, timestamp=timestamp)
-        
-        # Track temp files for cleanup
-        self.temp_files.extend([json_file, csv_file, metadata_file])
+            # One progress line instead of several prints per repository
+            progress = tqdm(total=len(repositories), desc=scope_name, unit='repo') if tqdm else None
+            scanned = 0
+            
+            def on_repository(repo, alert_count):
+                nonlocal scanned
+                scanned += 1
+                logger.debug("Processed %s: %d Code Scanning alert(s)", repo, alert_count)
+                if progress is not None:
+                    progress.update()
+                elif scanned % PROGRESS_LOG_INTERVAL == 0:
+                    logger.info("Scanned %d/%d repositories (%d alerts so far)",
+                                scanned, len(repositories), writer.total_alerts + alert_count)
+            
+            # The scope's repositories are scanned as configured, not filtered
+            # against the organization listing
+            for alerts in self.scanner.iter_organization_alerts(org_name, repositories, max_workers,
+                                                                on_repository=on_repository,
+                                                                filter_to_listing=False):
+                writer.write(alerts)
+            if progress is not None:
+                progress.close()
+            else:
+                logger.info("Scanned %d/%d repositories (%d alerts)", scanned, len(repositories), writer.total_alerts)
+        
+        if not scanned:
+            raise RuntimeError(f"No repositories of scope '{scope_name}' could be scanned")
+        
+        metadata_file = self.scanner.save_metadata(timestamp)
+        self.temp_files.append(metadata_file)
+        json_file, csv_file = writer.json_filename, writer.csv_filename
+        
+        # Print scan summary (counts by state) in a single write
+        print("\n".join([
+            f"\n{_HR}",
+            "📊 SCAN SUMMARY",
+            _HR,
+            f"Total repositories scanned: {scanned}",
+            f"Total Code Scanning alerts found: {writer.total_alerts}",
+            f"  • Open alerts: {writer.state_counts['open']}",
+            f"  • Fixed alerts: {writer.state_counts['fixed']}",
+            f"  • Dismissed alerts: {writer.state_counts['dismissed']}",
+            f"{_HR}\n",
+        ]))
         
         return json_file, csv_file, metadata_file
     
@@ -249,11 +318,14 @@ class CodeScanningPipeline:
             scope_name: Name of the scope
             repositories: List of scoped repositories
         """
-        print(f"\n{'='*60}")
+        print(f"\n{_HR}")
         print(f"📊 GENERATING REPORTS")
-        print(f"{'='*60}\n")
+        print(f"{_HR}\n")
         
         # Initialize report generator
+        CodeScanningReportGenerator = _load_component(
+            'reporters.code_scanning_report_generator', 'CodeScanningReportGenerator'
+        )
         self.report_generator = CodeScanningReportGenerator(
             scoped_repositories=repositories,
             active_scope=scope_name
@@ -284,16 +356,21 @@ class CodeScanningPipeline:
         
         print(f"\n🧹 Cleaning up {len(self.temp_files)} temporary files...")
         
+        # Unlink directly (no exists() stat first) and print the results in one go
+        messages = []
         for temp_file in self.temp_files:
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    print(f"✅ Removed: {temp_file}")
-            except Exception as e:
-                print(f"⚠️  Could not remove {temp_file}: {e}")
+                os.unlink(temp_file)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                messages.append(f"⚠️  Could not remove {temp_file}: {e}")
+            else:
+                messages.append(f"✅ Removed: {temp_file}")
         
         self.temp_files = []
-        print("✅ Cleanup complete")
+        messages.append("✅ Cleanup complete")
+        print("\n".join(messages))
     
     def run(self, scope_name: Optional[str] = None, skip_cleanup: bool = False):
         """
@@ -303,11 +380,11 @@ class CodeScanningPipeline:
             scope_name: Optional scope name. If not provided, will prompt user.
             skip_cleanup: If True, keep temporary files
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
-        print("\n" + "="*60)
+        print("\n" + _HR)
         print("🛡️  CODE SCANNING SECURITY PIPELINE")
-        print("="*60)
+        print(_HR)
         
         # Validate configuration
         if not self._validate_config():
@@ -335,13 +412,13 @@ class CodeScanningPipeline:
                 print(f"\nℹ️  Temporary files kept: {self.temp_files}")
             
             # Summary
-            duration = datetime.now() - start_time
-            print(f"\n{'='*60}")
+            duration = timedelta(seconds=time.perf_counter() - start_time)
+            print(f"\n{_HR}")
             print(f"✅ PIPELINE COMPLETED SUCCESSFULLY")
             print(f"Duration: {duration}")
             if self.reports_directory:
                 print(f"Reports: {self.reports_directory}")
-            print(f"{'='*60}\n")
+            print(f"{_HR}\n")
             
         except KeyboardInterrupt:
             print("\n⚠️  Pipeline interrupted by user")
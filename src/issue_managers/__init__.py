@@ -1,7 +1,17 @@
 """
 Issue Managers module - Contains GitHub issue management implementations.
+
+Exports are resolved lazily (PEP 562) so importing the package, e.g. for one
+of its scripts, does not load GitHubIssueManager and its dependencies.
 """
 
-from .github_issue_manager import GitHubIssueManager
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:  # Imported as a top-level package, with src/ on sys.path
+    from utils.lazy_exports import lazy_exports
 
 __all__ = ['GitHubIssueManager']
+
+__getattr__ = lazy_exports(__name__, {
+    'GitHubIssueManager': '.github_issue_manager',
+})
@@ -2,28 +2,40 @@
 Script to add issues to GitHub Project 23 (OPL Management)
 """
 
-import os
 import sys
-import requests
+from pathlib import Path
+from typing import List, Optional, Tuple
+
 from dotenv import load_dotenv
-from github import Github
+
+# Shared helpers live in src/utils; put src/ on the path when run as a script
+_src_dir = str(Path(__file__).resolve().parent.parent)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+from utils.github_env import read_github_env
+from utils.github_session import create_github_session
 
 load_dotenv()
 
+# GitHub settings, read once now that .env is loaded
+_ENV = read_github_env('MiDAS')
 
-def add_issue_to_project(issue_node_id: str, project_number: int, github_token: str, org_name: str, github_enterprise_url: str) -> bool:
+# Shared GraphQL session: keep-alive, transient-error and rate-limit retries
+_SESSION = create_github_session(allowed_methods=('POST',))
+
+
+def get_project_id(project_number: int, github_token: str, org_name: str, github_enterprise_url: str) -> Optional[str]:
     """
-    Add an issue to a GitHub Project.
+    Look up the node ID of an organization's GitHub Project.
     
     Args:
-        issue_node_id: The global node ID of the issue
         project_number: Project number (e.g., 23)
         github_token: GitHub authentication token
         org_name: Organization name
         github_enterprise_url: GitHub Enterprise URL
         
     Returns:
-        True if added successfully, False otherwise
+        The project node ID, or None if it could not be resolved
     """
     graphql_url = f"{github_enterprise_url}/api/graphql"
     headers = {
@@ -31,7 +43,6 @@ def add_issue_to_project(issue_node_id: str, project_number: int, github_token:
         'Content-Type': 'application/json'
     }
     
-    # First, get the project ID
     project_query = """
     query($org: String!, $number: Int!) {
       organization(login: $org) {
@@ -42,7 +53,7 @@ def add_issue_to_project(issue_node_id: str, project_number: int, github_token:
     }
     """
     
-    response = requests.post(
+    response = _SESSION.post(
         graphql_url,
         headers=headers,
         json={
@@ -56,60 +67,161 @@ def add_issue_to_project(issue_node_id: str, project_number: int, github_token:
     
     if response.status_code != 200:
         print(f"  Error getting project: {response.status_code}")
-        return False
+        return None
     
     data = response.json()
     if 'errors' in data:
         print(f"  GraphQL errors: {data['errors']}")
-        return False
+        return None
     
     project_id = data.get('data', {}).get('organization', {}).get('projectV2', {}).get('id')
     
     if not project_id:
         print(f"  Project {project_number} not found")
-        return False
+        return None
     
-    # Add the issue to the project
-    add_mutation = """
-    mutation($projectId: ID!, $contentId: ID!) {
-      addProjectV2ItemById(input: {
-        projectId: $projectId
-        contentId: $contentId
-      }) {
-        item {
-          id
-        }
-      }
+    return project_id
+
+
+def get_issue_node_ids(repos_and_issues: List[Tuple[str, int]], github_token: str, org_name: str, github_enterprise_url: str) -> List[Optional[Tuple[str, str]]]:
+    """
+    Resolve the node IDs of several issues with a single aliased GraphQL query.
+    
+    Args:
+        repos_and_issues: (repository name, issue number) pairs within the organization
+        github_token: GitHub authentication token
+        org_name: Organization name
+        github_enterprise_url: GitHub Enterprise URL
+        
+    Returns:
+        One (node_id, title) tuple per issue, in the order given, or None if it was not found
+    """
+    if not repos_and_issues:
+        return []
+    
+    graphql_url = f"{github_enterprise_url}/api/graphql"
+    headers = {
+        'Authorization': f'Bearer {github_token}',
+        'Content-Type': 'application/json'
     }
+    
+    # One aliased repository/issue lookup per pair: r0, r1, ...
+    variable_defs = ''.join(f', $n{i}: String!, $i{i}: Int!' for i in range(len(repos_and_issues)))
+    lookups = '\n'.join(
+        f'  r{i}: repository(owner: $owner, name: $n{i}) {{ issue(number: $i{i}) {{ id title }} }}'
+        for i in range(len(repos_and_issues))
+    )
+    issue_query = f"query($owner: String!{variable_defs}) {{\n{lookups}\n}}"
+    variables = {'owner': org_name}
+    for i, (repo_name, issue_num) in enumerate(repos_and_issues):
+        variables[f'n{i}'] = repo_name
+        variables[f'i{i}'] = issue_num
+    
+    response = _SESSION.post(
+        graphql_url,
+        headers=headers,
+        json={
+            'query': issue_query,
+            'variables': variables
+        }
+    )
+    
+    if response.status_code != 200:
+        print(f"  Error getting issues: {response.status_code}")
+        return [None] * len(repos_and_issues)
+    
+    data = response.json()
+    if 'errors' in data:
+        # Missing repositories/issues are reported here; the others still resolve
+        print(f"  GraphQL errors: {data['errors']}")
+    
+    results = data.get('data') or {}
+    issues = []
+    for i in range(len(repos_and_issues)):
+        issue = (results.get(f'r{i}') or {}).get('issue')
+        issues.append((issue['id'], issue['title']) if issue else None)
+    return issues
+
+
+def add_issues_to_project(issue_node_ids: List[str], project_id: str, github_token: str, github_enterprise_url: str) -> List[bool]:
+    """
+    Add several issues to a GitHub Project with a single aliased GraphQL mutation.
+    
+    Args:
+        issue_node_ids: Global node IDs of the issues to add
+        project_id: Node ID of the target project
+        github_token: GitHub authentication token
+        github_enterprise_url: GitHub Enterprise URL
+        
+    Returns:
+        One success flag per issue, in the order given
     """
+    if not issue_node_ids:
+        return []
+    
+    graphql_url = f"{github_enterprise_url}/api/graphql"
+    headers = {
+        'Authorization': f'Bearer {github_token}',
+        'Content-Type': 'application/json'
+    }
     
-    add_response = requests.post(
+    # One aliased addProjectV2ItemById per issue: a0, a1, ...
+    variable_defs = ''.join(f', $c{i}: ID!' for i in range(len(issue_node_ids)))
+    mutations = '\n'.join(
+        f'  a{i}: addProjectV2ItemById(input: {{projectId: $projectId, contentId: $c{i}}}) {{ item {{ id }} }}'
+        for i in range(len(issue_node_ids))
+    )
+    add_mutation = f"mutation($projectId: ID!{variable_defs}) {{\n{mutations}\n}}"
+    variables = {'projectId': project_id}
+    variables.update({f'c{i}': node_id for i, node_id in enumerate(issue_node_ids)})
+    
+    add_response = _SESSION.post(
         graphql_url,
         headers=headers,
         json={
             'query': add_mutation,
-            'variables': {
-                'projectId': project_id,
-                'contentId': issue_node_id
-            }
+            'variables': variables
         }
     )
     
-    if add_response.status_code == 200:
-        add_data = add_response.json()
-        if 'errors' not in add_data:
-            return True
-        else:
-            print(f"  Error adding to project: {add_data['errors']}")
+    if add_response.status_code != 200:
+        print(f"  Error adding to project: {add_response.status_code}")
+        return [False] * len(issue_node_ids)
+    
+    add_data = add_response.json()
+    if 'errors' in add_data:
+        print(f"  Error adding to project: {add_data['errors']}")
+    
+    results = add_data.get('data') or {}
+    return [bool(results.get(f'a{i}')) for i in range(len(issue_node_ids))]
+
+
+def add_issue_to_project(issue_node_id: str, project_number: int, github_token: str, org_name: str, github_enterprise_url: str) -> bool:
+    """
+    Add an issue to a GitHub Project.
     
-    return False
+    Args:
+        issue_node_id: The global node ID of the issue
+        project_number: Project number (e.g., 23)
+        github_token: GitHub authentication token
+        org_name: Organization name
+        github_enterprise_url: GitHub Enterprise URL
+        
+    Returns:
+        True if added successfully, False otherwise
+    """
+    project_id = get_project_id(project_number, github_token, org_name, github_enterprise_url)
+    if not project_id:
+        return False
+    
+    return add_issues_to_project([issue_node_id], project_id, github_token, github_enterprise_url)[0]
 
 
 def main():
     # Get credentials
-    github_token = os.getenv('GITHUB_TOKEN')
-    github_org = os.getenv('GITHUB_ORG', 'MiDAS')
-    github_enterprise_url = os.getenv('GITHUB_ENTERPRISE_URL')
+    github_token = _ENV.github_token
+    github_org = _ENV.org_name
+    github_enterprise_url = _ENV.enterprise_url
     
     if not github_token:
         print("ERROR: GITHUB_TOKEN not found in environment variables")
@@ -123,11 +235,6 @@ def main():
     print("=" * 70)
     print()
     
-    # Initialize GitHub client
-    base_url = f"{github_enterprise_url}/api/v3"
-    github = Github(base_url=base_url, login_or_token=github_token)
-    org = github.get_organization(github_org)
-    
     # Issues to add
     repos_and_issues = [
         ('uc-dar-api', 185),
@@ -136,32 +243,45 @@ def main():
     
     stats = {'added': 0, 'errors': 0}
     
-    for repo_name, issue_num in repos_and_issues:
-        try:
-            repo = org.get_repo(repo_name)
-            issue = repo.get_issue(issue_num)
-            
-            print(f"Processing: {repo_name} #{issue_num}")
-            print(f"  Title: {issue.title}")
-            
-            # Add to project
-            success = add_issue_to_project(
-                issue.node_id,
-                23,  # OPL Management project number
-                github_token,
-                github_org,
-                github_enterprise_url
-            )
-            
-            if success:
-                print(f"  -> Added to Project #23\n")
-                stats['added'] += 1
-            else:
-                print(f"  -> Failed to add to project\n")
-                stats['errors'] += 1
-                
-        except Exception as e:
-            print(f"ERROR processing {repo_name} #{issue_num}: {e}\n")
+    # Resolve the project once for the whole batch
+    project_id = get_project_id(
+        23,  # OPL Management project number
+        github_token,
+        github_org,
+        github_enterprise_url
+    )
+    if not project_id:
+        print("ERROR: could not resolve Project #23")
+        sys.exit(1)
+    
+    # Resolve every issue's node ID in one query
+    pending = []  # (repo_name, issue_num, node_id)
+    issues = get_issue_node_ids(repos_and_issues, github_token, github_org, github_enterprise_url)
+    for (repo_name, issue_num), issue in zip(repos_and_issues, issues):
+        if issue is None:
+            print(f"ERROR processing {repo_name} #{issue_num}: issue not found\n")
+            stats['errors'] += 1
+            continue
+        
+        node_id, title = issue
+        print(f"Processing: {repo_name} #{issue_num}")
+        print(f"  Title: {title}")
+        pending.append((repo_name, issue_num, node_id))
+    
+    # Add every resolved issue in one request
+    print()
+    results = add_issues_to_project(
+        [node_id for _, _, node_id in pending],
+        project_id,
+        github_token,
+        github_enterprise_url
+    )
+    for (repo_name, issue_num, _), success in zip(pending, results):
+        if success:
+            print(f"{repo_name} #{issue_num} -> Added to Project #23")
+            stats['added'] += 1
+        else:
+            print(f"{repo_name} #{issue_num} -> Failed to add to project")
             stats['errors'] += 1
     
     # Print summary
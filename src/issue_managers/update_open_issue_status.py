@@ -3,20 +3,215 @@ Script to update GitHub Projects status for open security issues.
 Changes status from "Done" to "In Progress" for all open issues with security-Vulnerability label.
 """
 
+import contextlib
+import json
+import logging
 import os
 import sys
+import threading
 import requests
-from datetime import datetime
-from dotenv import load_dotenv
-from github import Github
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
-# Load environment variables
-load_dotenv()
+# Shared helpers live in src/utils; put src/ on the path when run as a script
+_src_dir = str(Path(__file__).resolve().parent.parent)
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+from utils.github_session import create_github_session
 
+try:
+    from tqdm import tqdm
+    from tqdm.contrib.logging import logging_redirect_tqdm
+except ImportError:  # Optional progress bar; progress is only logged otherwise
+    tqdm = None
 
-def update_project_status_to_in_progress(issue_node_id: str, github_token: str, org_name: str, github_enterprise_url: str) -> bool:
+# Per-issue progress goes through logging so --quiet can silence it;
+# the banner and summary are always printed
+logger = logging.getLogger(__name__)
+
+# Repositories processed concurrently by main
+MAX_WORKERS = 16
+
+# Issues whose GraphQL updates are in flight at once, across all repositories
+GRAPHQL_WORKERS = 20
+
+# Project items updated per aliased GraphQL mutation
+MUTATION_BATCH_SIZE = 20
+
+# The automated issues this script looks after
+SECURITY_LABEL = 'security-Vulnerability'
+ISSUE_TITLE = 'fix all dependabot issues'
+
+# The Search API returns at most this many results for one query
+SEARCH_RESULT_LIMIT = 1000
+
+# Per-organization time of the last complete run, used by --since-last-run.
+# Kept in the project root (not the working directory) unless GITHUB_SCAN_STATE is set.
+SCAN_STATE_FILE = str(Path(__file__).resolve().parent.parent.parent / '.scan_state.json')
+
+# Pause GraphQL calls until the rate limit resets once fewer requests than this remain
+RATE_LIMIT_FLOOR = 100
+
+# Shared GraphQL session so keep-alive connections are reused across issues;
+# it also retries transient errors and rate-limit responses
+_SESSION = create_github_session(pool_maxsize=50, rate_limit_floor=RATE_LIMIT_FLOOR)
+
+# One lock per project, held around its Status field lookup: concurrent workers
+# that miss the cache for the same project wait for one request instead of each
+# sending their own, while lookups for different projects run in parallel.
+# _STATUS_FIELD_LOCKS_GUARD is only held to create a project's lock.
+_STATUS_FIELD_LOCKS: Dict[Tuple[str, int], threading.Lock] = {}
+_STATUS_FIELD_LOCKS_GUARD = threading.Lock()
+
+
+def _status_field_lock(org_name: str, project_number: int) -> threading.Lock:
+    """Return the lock guarding one project's Status field lookup."""
+    with _STATUS_FIELD_LOCKS_GUARD:
+        return _STATUS_FIELD_LOCKS.setdefault((org_name, project_number), threading.Lock())
+
+
+@lru_cache(maxsize=None)
+def get_status_field(org_name: str, project_number: int, github_token: str, github_enterprise_url: str) -> Optional[Tuple[str, str, str]]:
     """
-    Update the GitHub Projects status to "In Progress" for an open issue.
+    Look up a project's Status field and the option open issues are moved to.
+    
+    Cached per project, so every issue in the same project reuses the first lookup.
+    
+    Args:
+        org_name: Organization name
+        project_number: Project number
+        github_token: GitHub authentication token
+        github_enterprise_url: GitHub Enterprise URL
+        
+    Returns:
+        (project_id, field_id, option_id), or None if the project has no usable Status field
+        
+    Raises:
+        requests.HTTPError: If the request fails (failures are not cached)
+    """
+    graphql_url = f"{github_enterprise_url}/api/graphql"
+    headers = {
+        'Authorization': f'Bearer {github_token}',
+        'Content-Type': 'application/json'
+    }
+    
+    # Get the project status field
+    project_query = """
+    query($org: String!, $number: Int!) {
+      organization(login: $org) {
+        projectV2(number: $number) {
+          id
+          field(name: "Status") {
+            ... on ProjectV2SingleSelectField {
+              id
+              options {
+                id
+                name
+              }
+            }
+          }
+        }
+      }
+    }
+    """
+    
+    proj_response = _SESSION.post(
+        graphql_url,
+        headers=headers,
+        json={
+            'query': project_query,
+            'variables': {
+                'org': org_name,
+                'number': project_number
+            }
+        }
+    )
+    proj_response.raise_for_status()
+    
+    proj_data = proj_response.json()
+    if 'errors' in proj_data:
+        return None
+    
+    project_data = proj_data.get('data', {}).get('organization', {}).get('projectV2', {})
+    status_field = project_data.get('field', {})
+    field_id = status_field.get('id')
+    
+    # Find "In Progress" or "To Do" option ID
+    target_option_id = None
+    for option in status_field.get('options', []):
+        option_name = option.get('name', '').lower()
+        # Prefer "In Progress", but accept "To Do" or similar as fallback
+        if option_name in ['in progress', 'in-progress', 'inprogress']:
+            target_option_id = option.get('id')
+            break
+        elif option_name in ['todo', 'to do', 'to-do', 'open']:
+            target_option_id = option.get('id')
+    
+    if not field_id or not target_option_id:
+        return None
+    
+    return project_data.get('id'), field_id, target_option_id
+
+
+def update_item_statuses(updates: List[Tuple[Tuple[str, str, str], str]], github_token: str, github_enterprise_url: str) -> List[bool]:
+    """
+    Set the Status of several project items with a single aliased GraphQL mutation.
+    
+    Args:
+        updates: ((project_id, field_id, option_id), project_item_id) pairs
+        github_token: GitHub authentication token
+        github_enterprise_url: GitHub Enterprise URL
+        
+    Returns:
+        One success flag per item, in the order given
+    """
+    if not updates:
+        return []
+    
+    graphql_url = f"{github_enterprise_url}/api/graphql"
+    headers = {
+        'Authorization': f'Bearer {github_token}',
+        'Content-Type': 'application/json'
+    }
+    
+    # One aliased updateProjectV2ItemFieldValue per item: u0, u1, ...
+    variable_defs = ', '.join(
+        f'$p{i}: ID!, $i{i}: ID!, $f{i}: ID!, $v{i}: String!' for i in range(len(updates))
+    )
+    mutations = '\n'.join(
+        f'  u{i}: updateProjectV2ItemFieldValue(input: {{projectId: $p{i}, itemId: $i{i}, fieldId: $f{i}, '
+        f'value: {{singleSelectOptionId: $v{i}}}}}) {{ projectV2Item {{ id }} }}'
+        for i in range(len(updates))
+    )
+    update_mutation = f"mutation({variable_defs}) {{\n{mutations}\n}}"
+    variables = {}
+    for i, ((project_id, field_id, option_id), item_id) in enumerate(updates):
+        variables.update({f'p{i}': project_id, f'i{i}': item_id, f'f{i}': field_id, f'v{i}': option_id})
+    
+    update_response = _SESSION.post(
+        graphql_url,
+        headers=headers,
+        json={
+            'query': update_mutation,
+            'variables': variables
+        }
+    )
+    
+    if update_response.status_code != 200:
+        return [False] * len(updates)
+    
+    results = update_response.json().get('data') or {}
+    return [bool(results.get(f'u{i}')) for i in range(len(updates))]
+
+
+def get_status_updates(issue_node_id: str, github_token: str, org_name: str, github_enterprise_url: str) -> List[Tuple[Tuple[str, str, str], str]]:
+    """
+    Find the project items of an open issue whose Status should be set.
     
     Args:
         issue_node_id: The global node ID of the issue
@@ -25,7 +220,7 @@ def update_project_status_to_in_progress(issue_node_id: str, github_token: str,
         github_enterprise_url: GitHub Enterprise URL
         
     Returns:
-        True if status was updated, False otherwise
+        ((project_id, field_id, option_id), project_item_id) pairs for update_item_statuses
     """
     graphql_url = f"{github_enterprise_url}/api/graphql"
     headers = {
@@ -52,26 +247,23 @@ def update_project_status_to_in_progress(issue_node_id: str, github_token: str,
     }
     """
     
-    response = requests.post(
+    response = _SESSION.post(
         graphql_url,
         headers=headers,
         json={'query': query, 'variables': {'nodeId': issue_node_id}}
     )
     
     if response.status_code != 200:
-        return False
+        return []
     
     data = response.json()
     if 'errors' in data:
-        return False
+        return []
     
     project_items = data.get('data', {}).get('node', {}).get('projectItems', {}).get('nodes', [])
     
-    if not project_items:
-        return False
-    
-    # For each project the issue is in, update status to "In Progress"
-    updated = False
+    # Resolve each project's Status field (cached per project)
+    updates = []
     for item in project_items:
         project_item_id = item.get('id')
         project_info = item.get('project', {})
@@ -79,99 +271,190 @@ def update_project_status_to_in_progress(issue_node_id: str, github_token: str,
         if not project_item_id:
             continue
         
-        # Get the project status field
-        project_query = """
-        query($org: String!, $number: Int!) {
-          organization(login: $org) {
-            projectV2(number: $number) {
-              id
-              field(name: "Status") {
-                ... on ProjectV2SingleSelectField {
-                  id
-                  options {
-                    id
-                    name
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        proj_response = requests.post(
-            graphql_url,
-            headers=headers,
-            json={
-                'query': project_query,
-                'variables': {
-                    'org': org_name,
-                    'number': project_info.get('number')
-                }
-            }
-        )
-        
-        if proj_response.status_code != 200:
+        try:
+            project_number = project_info.get('number')
+            with _status_field_lock(org_name, project_number):
+                status_field = get_status_field(org_name, project_number, github_token, github_enterprise_url)
+        except requests.RequestException:
             continue
         
-        proj_data = proj_response.json()
-        if 'errors' in proj_data:
-            continue
+        if status_field is not None:
+            updates.append((status_field, project_item_id))
+    
+    return updates
+
+
+def update_project_status_to_in_progress(issue_node_id: str, github_token: str, org_name: str, github_enterprise_url: str) -> bool:
+    """
+    Update the GitHub Projects status to "In Progress" for an open issue.
+    
+    Args:
+        issue_node_id: The global node ID of the issue
+        github_token: GitHub authentication token
+        org_name: Organization name
+        github_enterprise_url: GitHub Enterprise URL
         
-        project_data = proj_data.get('data', {}).get('organization', {}).get('projectV2', {})
-        status_field = project_data.get('field', {})
-        field_id = status_field.get('id')
+    Returns:
+        True if status was updated, False otherwise
+    """
+    updates = get_status_updates(issue_node_id, github_token, org_name, github_enterprise_url)
+    return any(update_item_statuses(updates, github_token, github_enterprise_url))
+
+
+def _scan_state_file() -> str:
+    """Path of the --since-last-run state file (GITHUB_SCAN_STATE, read after .env is loaded)."""
+    return os.getenv('GITHUB_SCAN_STATE') or SCAN_STATE_FILE
+
+
+def load_last_run(org_name: str) -> Optional[datetime]:
+    """Return when the last complete run for the organization started, if recorded."""
+    try:
+        with open(_scan_state_file(), 'r', encoding='utf-8') as f:
+            last_run = json.load(f).get(org_name)
+        return datetime.fromisoformat(last_run) if last_run else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_last_run(org_name: str, started: datetime):
+    """Record the start of a complete run, replacing the state file atomically."""
+    state_file = _scan_state_file()
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    state[org_name] = started.isoformat()
+    
+    temp_file = f"{state_file}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(temp_file, state_file)
+
+
+def search_open_security_issues(github, org_name: str, since: Optional[datetime] = None) -> Optional[Dict[str, list]]:
+    """
+    Find the organization's open automated security issues with one Search API query.
+    
+    Args:
+        github: PyGithub client
+        org_name: Organization name
+        since: Only return issues updated at or after this time
         
-        # Find "In Progress" or "To Do" option ID
-        target_option_id = None
-        for option in status_field.get('options', []):
-            option_name = option.get('name', '').lower()
-            # Prefer "In Progress", but accept "To Do" or similar as fallback
-            if option_name in ['in progress', 'in-progress', 'inprogress']:
-                target_option_id = option.get('id')
-                break
-            elif option_name in ['todo', 'to do', 'to-do', 'open']:
-                target_option_id = option.get('id')
+    Returns:
+        Matching issues by repository name, or None if search is unavailable or
+        there are more matches than the Search API returns
+    """
+    from github import GithubException
+    
+    query = f'org:{org_name} is:issue is:open label:"{SECURITY_LABEL}" in:title "{ISSUE_TITLE}"'
+    if since is not None:
+        query += f' updated:>={since.strftime("%Y-%m-%dT%H:%M:%SZ")}'
+    try:
+        results = github.search_issues(query)
+        issues_by_repo = {}
+        found = 0
+        for issue in results:
+            # The repository name is the last part of repository_url; reading
+            # issue.repository.name would fetch the repository
+            issues_by_repo.setdefault(issue.repository_url.rsplit('/', 1)[-1], []).append(issue)
+            found += 1
+        if results.totalCount > found:
+            logger.warning(f"{results.totalCount} matching issues exceed the Search API limit of {SEARCH_RESULT_LIMIT}")
+            return None
+        return issues_by_repo
+    except GithubException as e:
+        logger.warning(f"Issue search unavailable ({e})")
+        return None
+
+
+def process_issues(repo_name: str, issues: Iterable, dry_run: bool, github_token: str, github_org: str,
+                   github_enterprise_url: str, graphql_executor: ThreadPoolExecutor) -> Tuple[List[Tuple[int, str, bool]], Counter, List[str]]:
+    """
+    Set the project status of one repository's automated security issues.
+    
+    Args:
+        repo_name: Repository name
+        issues: The repository's open security issues (may be a lazy PaginatedList)
+        dry_run: Only count the issues that would be updated
+        github_token: GitHub authentication token
+        github_org: Organization name
+        github_enterprise_url: GitHub Enterprise URL
+        graphql_executor: Pool the issues' project item lookups and batched mutations
+            are submitted to, so a repository's issues are handled concurrently
         
-        if not field_id or not target_option_id:
-            continue
+    Returns:
+        (issue number, title, status updated) per matching issue, the repository's
+        statistics, and its error messages
+    """
+    results = []
+    stats = Counter(repos_checked=1)
+    errors = []
+    
+    try:
+        matching = []
+        for issue in issues:
+            stats['issues_found'] += 1
+            
+            # Check if it's our automated issue format
+            if ISSUE_TITLE in issue.title.lower():
+                matching.append(issue)
         
-        # Update the status
-        update_mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $valueId: String!) {
-          updateProjectV2ItemFieldValue(input: {
-            projectId: $projectId
-            itemId: $itemId
-            fieldId: $fieldId
-            value: {singleSelectOptionId: $valueId}
-          }) {
-            projectV2Item {
-              id
-            }
-          }
-        }
-        """
+        if dry_run:
+            stats['status_updated'] += len(matching)
+            return [(issue.number, issue.title, False) for issue in matching], stats, errors
         
-        update_response = requests.post(
-            graphql_url,
-            headers=headers,
-            json={
-                'query': update_mutation,
-                'variables': {
-                    'projectId': project_data.get('id'),
-                    'itemId': project_item_id,
-                    'fieldId': field_id,
-                    'valueId': target_option_id
-                }
-            }
-        )
+        # Look up the project items of every matching issue concurrently
+        pending = [
+            graphql_executor.submit(
+                get_status_updates,
+                issue.node_id,
+                github_token,
+                github_org,
+                github_enterprise_url
+            )
+            for issue in matching
+        ]
+        issue_updates = [future.result() for future in pending]
         
-        if update_response.status_code == 200:
-            update_data = update_response.json()
-            if 'errors' not in update_data:
-                updated = True
+        # Then update all of the repository's items in batched mutations; an
+        # issue counts as updated if any of its items was
+        succeeded = iter(apply_status_updates(
+            [update for updates in issue_updates for update in updates],
+            github_token,
+            github_enterprise_url,
+            graphql_executor
+        ))
+        for issue, updates in zip(matching, issue_updates):
+            updated = any([next(succeeded) for _ in updates])
+            results.append((issue.number, issue.title, updated))
+            if updated:
+                stats['status_updated'] += 1
+                
+    except Exception as e:
+        errors.append(f"ERROR processing {repo_name}: {e}")
+        stats['errors'] += 1
+    
+    return results, stats, errors
+
+
+def apply_status_updates(updates: List[Tuple[Tuple[str, str, str], str]], github_token: str, github_enterprise_url: str,
+                         graphql_executor: ThreadPoolExecutor) -> List[bool]:
+    """
+    Send status updates in aliased mutations of up to MUTATION_BATCH_SIZE items each.
     
-    return updated
+    Returns:
+        One success flag per update, in the order given
+    """
+    def send(batch):
+        try:
+            return update_item_statuses(batch, github_token, github_enterprise_url)
+        except (requests.RequestException, ValueError):
+            # ValueError: a 200 response whose body is not JSON
+            return [False] * len(batch)
+    
+    batches = [updates[i:i + MUTATION_BATCH_SIZE] for i in range(0, len(updates), MUTATION_BATCH_SIZE)]
+    return [flag for flags in graphql_executor.map(send, batches) for flag in flags]
 
 
 def main():
@@ -179,8 +462,29 @@ def main():
     
     parser = argparse.ArgumentParser(description='Update project status for open security issues')
     parser.add_argument('--dry-run', action='store_true', help='Preview without making changes')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Only print warnings, errors and the summary')
+    parser.add_argument('--since-last-run', action='store_true',
+                        help='Only check issues updated since the last complete run (recorded in '
+                             'GITHUB_SCAN_STATE, default .scan_state.json in the project root). Moving an '
+                             'issue\'s project card does not change its updated_at, so issues whose card was '
+                             'moved back to Done without other activity are skipped; run without this flag '
+                             'periodically to catch them')
     args = parser.parse_args()
     
+    # dotenv and PyGithub are only imported once the arguments are valid, so
+    # --help and usage errors return without loading them
+    from dotenv import load_dotenv
+    from github import Github
+    
+    # Load environment variables
+    load_dotenv()
+    
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    
     # Get credentials
     github_token = os.getenv('GITHUB_TOKEN')
     github_org = os.getenv('GITHUB_ORG', 'MiDAS')
@@ -198,80 +502,106 @@ def main():
     print("=" * 70)
     print()
     
-    # Initialize GitHub client
+    # Initialize GitHub client: 100 results per page (the REST maximum) instead of
+    # the default 30, and a connection pool sized for the worker threads
+    client_options = {'per_page': 100, 'pool_size': MAX_WORKERS}
     if github_enterprise_url:
         base_url = f"{github_enterprise_url}/api/v3"
-        github = Github(base_url=base_url, login_or_token=github_token)
+        github = Github(base_url=base_url, login_or_token=github_token, **client_options)
     else:
-        github = Github(github_token)
+        github = Github(github_token, **client_options)
     
     org = github.get_organization(github_org)
     
     # Statistics
-    stats = {
-        'repos_checked': 0,
-        'issues_found': 0,
-        'status_updated': 0,
-        'errors': 0
-    }
+    stats = Counter(repos_checked=0, issues_found=0, status_updated=0, errors=0)
+    
+    # Moving a project card does not change the issue's updated_at, so the
+    # watermark is opt-in: a default run checks every open issue
+    run_started = datetime.now(timezone.utc)
+    since = load_last_run(github_org) if args.since_last_run else None
+    if since is not None:
+        print(f"Only checking issues updated since {since.isoformat()}\n")
     
     print("Scanning repositories for open security issues...\n")
     
-    # Get all repositories
+    # One search query finds the matching issues of the whole organization;
+    # if it cannot be used, list each repository's labelled issues instead
+    issues_by_repo = None
     try:
-        for repo in org.get_repos():
-            try:
-                stats['repos_checked'] += 1
-                
-                # Get open issues with security-Vulnerability label
-                issues = repo.get_issues(
-                    state='open',
-                    labels=['security-Vulnerability']
+        issues_by_repo = search_open_security_issues(github, github_org, since)
+        if issues_by_repo is not None:
+            work = list(issues_by_repo.items())
+        else:
+            logger.info("Listing open security issues repository by repository...\n")
+            since_filter = {'since': since} if since is not None else {}
+            work = [
+                (repo.name, repo.get_issues(state='open', labels=[SECURITY_LABEL], **since_filter))
+                for repo in org.get_repos()
+            ]
+        
+        # Repositories are independent: process them concurrently, printing each
+        # one's progress as soon as it and the repositories before it are done.
+        # The repository pool is shut down first, so no worker submits to a
+        # closed GraphQL pool.
+        with ThreadPoolExecutor(max_workers=GRAPHQL_WORKERS) as graphql_executor:
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                results = executor.map(
+                    lambda repo_issues: process_issues(*repo_issues, args.dry_run, github_token, github_org,
+                                                       github_enterprise_url, graphql_executor),
+                    work
                 )
-                
-                for issue in issues:
-                    stats['issues_found'] += 1
-                    
-                    # Check if it's our automated issue format
-                    if "fix all dependabot issues" not in issue.title.lower():
-                        continue
-                    
-                    print(f"Found: {repo.name} #{issue.number}")
-                    print(f"  Title: {issue.title}")
-                    
-                    if not args.dry_run:
-                        # Update project status
-                        updated = update_project_status_to_in_progress(
-                            issue.node_id,
-                            github_token,
-                            github_org,
-                            github_enterprise_url
-                        )
-                        
-                        if updated:
-                            print(f"  -> Status updated to 'In Progress'\n")
-                            stats['status_updated'] += 1
+                # With tqdm, a progress bar tracks repositories and log lines are
+                # printed above it instead of breaking it up
+                progress = tqdm(total=len(work), desc='Scanning repos', unit='repo') if tqdm else None
+                with logging_redirect_tqdm() if progress is not None else contextlib.nullcontext():
+                    for (repo_name, _), (issue_results, repo_stats, errors) in zip(work, results):
+                        lines = []
+                        if args.dry_run:
+                            # Dry runs only count: one line per repository instead of three per issue
+                            if issue_results:
+                                lines.append((logging.INFO, f"{repo_name}: would update status of {len(issue_results)} issue(s) (dry-run)"))
                         else:
-                            print(f"  -> No status update needed or not in project\n")
-                    else:
-                        print(f"  -> Would update status (dry-run)\n")
-                        stats['status_updated'] += 1
+                            for number, title, updated in issue_results:
+                                lines.append((logging.INFO, f"Found: {repo_name} #{number}"))
+                                lines.append((logging.INFO, f"  Title: {title}"))
+                                if updated:
+                                    lines.append((logging.INFO, f"  -> Status updated to 'In Progress'\n"))
+                                else:
+                                    lines.append((logging.INFO, f"  -> No status update needed or not in project\n"))
+                        lines.extend((logging.ERROR, message) for message in errors)
                         
-            except Exception as e:
-                print(f"ERROR processing {repo.name}: {e}")
-                stats['errors'] += 1
+                        # One log call per run of same-level lines: a repository's
+                        # progress is written (and the bar redrawn) once, not per line
+                        for level, records in groupby(lines, key=lambda record: record[0]):
+                            logger.log(level, '\n'.join(message for _, message in records))
+                        stats.update(repo_stats)
+                        if progress is not None:
+                            progress.update()
+                if progress is not None:
+                    progress.close()
                 
     except Exception as e:
-        print(f"ERROR scanning repositories: {e}")
+        logger.error(f"ERROR scanning repositories: {e}")
         stats['errors'] += 1
     
+    # Advance the watermark only after a complete live run, so issues that
+    # failed are checked again next time
+    if args.since_last_run and not args.dry_run and not stats['errors']:
+        save_last_run(github_org, run_started)
+    
     # Print summary
     print()
     print("=" * 70)
     print("SUMMARY")
     print("=" * 70)
-    print(f"Repositories checked:   {stats['repos_checked']}")
-    print(f"Open issues found:      {stats['issues_found']}")
+    if issues_by_repo is not None:
+        # The search only returns automated issues, so only their repositories are visited
+        print(f"Repositories matched:   {stats['repos_checked']}")
+        print(f"Matching issues found:  {stats['issues_found']}")
+    else:
+        print(f"Repositories checked:   {stats['repos_checked']}")
+        print(f"Open issues found:      {stats['issues_found']}")
     print(f"Status updated:         {stats['status_updated']}")
     print(f"Errors:                 {stats['errors']}")
     print("=" * 70)
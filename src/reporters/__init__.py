@@ -1,8 +1,18 @@
 """
 Reporters module - Contains report generation implementations.
+
+Generators are resolved lazily (PEP 562) so importing the package does not
+pull in pandas/openpyxl until a generator is actually used.
 """
 
-from .security_report_generator import SecurityReportGenerator
-from .code_scanning_report_generator import CodeScanningReportGenerator
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:  # Imported as a top-level package, with src/ on sys.path
+    from utils.lazy_exports import lazy_exports
 
 __all__ = ['SecurityReportGenerator', 'CodeScanningReportGenerator']
+
+__getattr__ = lazy_exports(__name__, {
+    'SecurityReportGenerator': '.security_report_generator',
+    'CodeScanningReportGenerator': '.code_scanning_report_generator',
+})
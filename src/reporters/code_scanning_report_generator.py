@@ -10,12 +10,153 @@ Version: 1.0.0
 """
 
 import os
+import numpy as np
 import pandas as pd
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+
+@lru_cache(maxsize=1)
+def _load_output_dir_cached() -> str:
+    """Load the report output directory from config/config.json once per process."""
+    try:
+        # Get project root (2 levels up from reporters/)
+        config_path = Path(__file__).resolve().parents[2] / 'config' / 'config.json'
+        raw = config_path.read_bytes()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        # Use codeql_output_dir if available, otherwise fall back to default
+        return config.get('scan', {}).get('codeql_output_dir', './reports/codeql_alerts')
+    except Exception:
+        return './reports/codeql_alerts'
+
+
+def _upper_categorical(column: pd.Series, fill_value: Optional[str] = None) -> pd.Series:
+    """
+    Upper-case a column as a categorical, transforming each distinct value once.
+    
+    Args:
+        column: Column to convert (categorical or plain strings)
+        fill_value: Optional replacement for missing values
+    """
+    column = column.astype('category')
+    if fill_value is not None and column.hasnans:
+        if fill_value not in column.cat.categories:
+            column = column.cat.add_categories([fill_value])
+        column = column.fillna(fill_value)
+    
+    upper = column.cat.categories.str.upper()
+    if upper.is_unique:
+        return column.cat.rename_categories(upper)
+    # Values differing only in case collapse into one category
+    return column.astype(object).str.upper().astype('category')
+
+
+def _excel_value(value):
+    """Convert a DataFrame value to the cell value pandas' to_excel would write."""
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return ''
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        return float(value)
+    return str(value)
+
+
+# Cell colour schemes (background, font colour) matching security_report_generator.py
+SEVERITY_COLORS = {
+    'CRITICAL': ('B1A0C7', '000000'),
+    'HIGH': ('FF0000', 'FFFFFF'),
+    'MEDIUM': ('F79646', '000000'),
+    'LOW': ('DAEEF3', '000000'),
+    'ERROR': ('FF0000', 'FFFFFF'),
+    'WARNING': ('F79646', '000000'),
+    'NOTE': ('DAEEF3', '000000')
+}
+
+STATUS_COLORS = {
+    'OPEN': ('FFFF00', '000000'),
+    'FIXED': ('92D050', '000000'),
+    'DISMISSED': ('D3D3D3', '000000')
+}
+
+# Executive summary count columns, coloured when non-zero (font colour None keeps the default font)
+EXECUTIVE_COUNT_COLORS = {
+    'Critical': ('B1A0C7', None),  # Purple
+    'High': ('FF0000', 'FFFFFF'),  # Red
+    'Medium': ('F79646', None),  # Orange
+    'Low': ('DAEEF3', None)  # Light Blue
+}
+
+
+# README header; the severity breakdown and top repositories are appended per report
+README_TEMPLATE = """# Code Scanning Security Report
+
+Generated: {generated}
+Scope: {scope}
+
+## Summary
+
+- **Total Repositories Scanned:** {repositories}
+- **Total Alerts Found:** {total}
+- **Open Alerts:** {open}
+- **Fixed Alerts:** {fixed}
+- **Dismissed Alerts:** {dismissed}
+
+## Report Files
+
+### CSV Files (Plain Text)
+1. **executive_summary.csv** - High-level summary by repository
+2. **detailed_alerts.csv** - Complete alert details
+
+### Excel Files (Formatted)
+1. **executive_summary.xlsx** - Formatted executive summary with styling
+2. **detailed_alerts.xlsx** - Formatted detailed alerts with styling
+
+## Severity Breakdown
+
+Open alerts by severity level:
+"""
+
+
+@lru_cache(maxsize=None)
+def _excel_styles() -> Dict:
+    """Build the shared openpyxl style objects once per process (openpyxl is imported on first use)."""
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    
+    def solid_fill(color):
+        return PatternFill(start_color=color, end_color=color, fill_type='solid')
+    
+    def color_styles(colors):
+        return {
+            key: (solid_fill(bg), Font(color=font, bold=True) if font else None)
+            for key, (bg, font) in colors.items()
+        }
+    
+    thin = Side(style='thin')
+    return {
+        'header_fill': solid_fill('366092'),
+        'header_font': Font(bold=True, color='FFFFFF', size=11),
+        'header_alignment': Alignment(horizontal='center', vertical='center', wrap_text=True),
+        'border': Border(left=thin, right=thin, top=thin, bottom=thin),
+        'severity': color_styles(SEVERITY_COLORS),
+        'status': color_styles(STATUS_COLORS),
+        'executive_counts': color_styles(EXECUTIVE_COUNT_COLORS),
+        'repo_clean': (solid_fill('92D050'), None),
+        'repo_alerts': (solid_fill('FFFF00'), None)
+    }
+
 
 class CodeScanningReportGenerator:
     """
@@ -39,6 +180,20 @@ class CodeScanningReportGenerator:
         'NOTE': 1
     }
     
+    # Severity column order and matching weight vector for the risk-score dot product
+    SEVERITY_ORDER = list(SEVERITY_WEIGHTS)
+    SEVERITY_WEIGHT_VECTOR = np.fromiter(SEVERITY_WEIGHTS.values(), dtype=np.int64)
+    
+    # Low-cardinality string columns stored as pandas categoricals after loading
+    CATEGORICAL_COLUMNS = (
+        'repository',
+        'alert_state',
+        'rule_severity',
+        'rule_security_severity_level',
+        'tool_name',
+        'scanned_branch'
+    )
+    
     # Responsible person mapping (loaded from config)
     RESPONSIBLE_MAP = None
     
@@ -50,9 +205,9 @@ class CodeScanningReportGenerator:
                 # Get project root: src/reporters -> src -> root
                 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
                 config_path = os.path.join(project_root, config_path)
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
-            return config
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception as e:
             print(f"⚠️  Could not load config: {e}")
             return {}
@@ -88,27 +243,15 @@ class CodeScanningReportGenerator:
         self.scoped_repositories = scoped_repositories or []
         self.active_scope = active_scope
         self.repository_metadata = {}
-        self.output_dir = self._load_output_dir_from_config()
-    
-    def _load_output_dir_from_config(self) -> str:
-        """Load output directory from config/config.json."""
-        try:
-            # Get project root (2 levels up from reporters/)
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            config_path = os.path.join(project_root, 'config', 'config.json')
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-            # Use codeql_output_dir if available, otherwise fall back to default
-            return config.get('scan', {}).get('codeql_output_dir', './reports/codeql_alerts')
-        except Exception:
-            return './reports/codeql_alerts'
+        self.output_dir = _load_output_dir_cached()
     
     def load_repository_metadata(self, metadata_file: str) -> bool:
         """Load repository metadata from JSON file."""
         try:
             if os.path.exists(metadata_file):
-                with open(metadata_file, 'r') as f:
-                    self.repository_metadata = json.load(f)
+                with open(metadata_file, 'rb') as f:
+                    raw = f.read()
+                self.repository_metadata = orjson.loads(raw) if orjson is not None else json.loads(raw)
                 print(f"✅ Loaded metadata for {len(self.repository_metadata)} repositories")
                 return True
             else:
@@ -118,28 +261,50 @@ class CodeScanningReportGenerator:
             print(f"⚠️  Error loading repository metadata: {e}")
             return False
     
-    def load_alert_data(self, data_source: str) -> bool:
+    def load_alert_data(self, data_source: str, use_parquet_cache: bool = False) -> bool:
         """
-        Load Code Scanning alert data from JSON or CSV file.
+        Load Code Scanning alert data from JSON, CSV or Parquet file.
         
         Args:
-            data_source: Path to JSON or CSV file
+            data_source: Path to JSON, CSV or Parquet file
+            use_parquet_cache: Reuse (or create) a Parquet copy of the normalized data next
+                to data_source. Useful when the same scan output is reported on repeatedly;
+                needs pyarrow or fastparquet and is skipped without them.
             
         Returns:
             True if data loaded successfully
         """
         try:
+            if use_parquet_cache and self._read_parquet_cache(data_source):
+                print(f"✅ Loaded {len(self.data)} Code Scanning alert records (Parquet cache)")
+                self._calculate_statistics()
+                return True
+            
             if data_source.endswith('.json'):
-                with open(data_source, 'r') as f:
-                    raw_data = json.load(f)
+                with open(data_source, 'rb') as f:
+                    raw_bytes = f.read()
+                raw_data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
+                del raw_bytes  # Drop the file buffer before pandas builds its columns
                 self.data = pd.DataFrame(raw_data)
             elif data_source.endswith('.csv'):
-                self.data = pd.read_csv(data_source)
+                # Parse the low-cardinality columns straight into categoricals; prefer the
+                # multithreaded pyarrow parser and fall back to the C engine without it
+                csv_dtypes = {col: 'category' for col in self.CATEGORICAL_COLUMNS}
+                try:
+                    self.data = pd.read_csv(data_source, engine='pyarrow', dtype=csv_dtypes)
+                except ImportError:
+                    self.data = pd.read_csv(data_source, dtype=csv_dtypes)
+            elif data_source.endswith('.parquet'):
+                # Columnar scan output (CodeScanningScanner.save_results(output_format='parquet'))
+                self.data = pd.read_parquet(data_source)
             else:
                 print(f"❌ Unsupported file format: {data_source}")
                 return False
             
             print(f"✅ Loaded {len(self.data)} Code Scanning alert records")
+            self._optimize_dtypes()
+            if use_parquet_cache:
+                self._write_parquet_cache(data_source)
             self._calculate_statistics()
             return True
             
@@ -147,24 +312,85 @@ class CodeScanningReportGenerator:
             print(f"❌ Error loading data: {e}")
             return False
     
+    @staticmethod
+    def _parquet_cache_path(data_source: str) -> Path:
+        """Parquet cache file kept next to the alert data file."""
+        return Path(data_source).with_suffix('.parquet')
+    
+    def _read_parquet_cache(self, data_source: str) -> bool:
+        """Load the Parquet cache if it exists and is not older than data_source."""
+        cache_path = self._parquet_cache_path(data_source)
+        try:
+            if cache_path.stat().st_mtime < Path(data_source).stat().st_mtime:
+                return False
+            self.data = pd.read_parquet(cache_path)
+            return True
+        except Exception:
+            # No cache yet, no Parquet engine installed, or an unreadable cache
+            return False
+    
+    def _write_parquet_cache(self, data_source: str):
+        """Save the normalized data (categoricals included) as the Parquet cache."""
+        cache_path = self._parquet_cache_path(data_source)
+        try:
+            self.data.to_parquet(cache_path, compression='zstd')
+        except Exception as e:
+            print(f"ℹ️  Parquet cache not written: {e}")
+    
+    def _optimize_dtypes(self):
+        """Normalize column dtypes after loading (categoricals for repeated strings, numeric alert age)."""
+        for col in self.CATEGORICAL_COLUMNS:
+            if col not in self.data.columns:
+                continue
+            if isinstance(self.data[col].dtype, pd.CategoricalDtype):
+                # Keep categories == observed values so their count is a distinct count
+                self.data[col] = self.data[col].cat.remove_unused_categories()
+            else:
+                self.data[col] = self.data[col].astype('category')
+        
+        # Security severity, falling back to rule severity, resolved once for the whole frame
+        has_security = 'rule_security_severity_level' in self.data.columns
+        has_rule = 'rule_severity' in self.data.columns
+        if has_security and has_rule:
+            combined = self.data['rule_security_severity_level'].astype(object).fillna(
+                self.data['rule_severity'].astype(object)
+            )
+        elif has_security:
+            combined = self.data['rule_security_severity_level'].astype(object)
+        elif has_rule:
+            combined = self.data['rule_severity'].astype(object)
+        else:
+            combined = pd.Series(np.nan, index=self.data.index, dtype=object)
+        self.data['combined_severity'] = combined.str.upper().astype('category')
+        
+        # Alert age as nullable integers, so it sorts numerically and is not written as 12.0
+        if 'alert_age_days' in self.data.columns:
+            self.data['alert_age_days'] = pd.to_numeric(self.data['alert_age_days'], errors='coerce').astype('Int32')
+    
     def _calculate_statistics(self):
         """Calculate alert statistics."""
         if self.data is None or self.data.empty:
             return
         
-        open_alerts = self.data[self.data['alert_state'] == 'open']
-        fixed_alerts = self.data[self.data['alert_state'] == 'fixed']
-        dismissed_alerts = self.data[self.data['alert_state'] == 'dismissed']
+        # One counting pass instead of materializing a filtered frame per state
+        state_counts = self.data['alert_state'].value_counts()
         
         self.stats = {
             'total_alerts': len(self.data),
-            'open_alerts': len(open_alerts),
-            'fixed_alerts': len(fixed_alerts),
-            'dismissed_alerts': len(dismissed_alerts),
-            'repositories_scanned': self.data['repository'].nunique() if not self.data.empty else 0,
-            'tools_used': self.data['tool_name'].nunique() if 'tool_name' in self.data.columns else 0
+            'open_alerts': int(state_counts.get('open', 0)),
+            'fixed_alerts': int(state_counts.get('fixed', 0)),
+            'dismissed_alerts': int(state_counts.get('dismissed', 0)),
+            'repositories_scanned': self._distinct_count(self.data['repository']),
+            'tools_used': self._distinct_count(self.data['tool_name']) if 'tool_name' in self.data.columns else 0
         }
     
+    @staticmethod
+    def _distinct_count(column: pd.Series) -> int:
+        """Number of distinct non-null values; O(1) for categoricals without unused categories."""
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return column.cat.categories.size
+        return column.nunique()
+    
     def generate_repository_executive_summary(self) -> pd.DataFrame:
         """
         Generate repository-focused executive summary report.
@@ -176,28 +402,25 @@ class CodeScanningReportGenerator:
             if self.scoped_repositories:
                 print("📊 Generating repository-focused executive summary for scoped repositories...")
                 print("⚠️  No alert data found, showing all scoped repositories as clean")
-                repo_summary = []
-                for repo in self.scoped_repositories:
-                    scanned_branch = self.repository_metadata.get(repo, {}).get('default_branch', 'N/A')
-                    responsible1, responsible2 = self.get_responsible(repo)
-                    repo_summary.append({
-                        'Repository Name': repo,
-                        'Scanned Branch': scanned_branch,
-                        'Responsible1': responsible1,
-                        'Responsible2': responsible2,
-                        'Risk Score': 0,
-                        'Total Open': 0,
-                        'Critical': 0,
-                        'High': 0,
-                        'Medium': 0,
-                        'Low': 0,
-                        'Error': 0,
-                        'Warning': 0,
-                        'Note': 0,
-                        'Total All Alerts': 0,
-                        'Fixed Alerts': 0,
-                        'Dismissed Alerts': 0
-                    })
+                repositories = list(self.scoped_repositories)
+                responsibles = [self.get_responsible(repo) for repo in repositories]
+                zeros = np.zeros(len(repositories), dtype=np.int64)
+                
+                # Columns are built directly; every count column is zero
+                repo_summary = {
+                    'Repository Name': repositories,
+                    'Scanned Branch': [
+                        self.repository_metadata.get(repo, {}).get('default_branch', 'N/A') for repo in repositories
+                    ],
+                    'Responsible1': [responsible[0] for responsible in responsibles],
+                    'Responsible2': [responsible[1] for responsible in responsibles],
+                    'Risk Score': zeros,
+                    'Total Open': zeros,
+                }
+                for severity in self.SEVERITY_ORDER:
+                    repo_summary[severity.capitalize()] = zeros
+                for col in ('Total All Alerts', 'Fixed Alerts', 'Dismissed Alerts'):
+                    repo_summary[col] = zeros
                 summary_df = pd.DataFrame(repo_summary)
                 summary_df.insert(0, 'Priority Rank', range(1, len(summary_df) + 1))
                 print(f"✅ Repository executive summary generated for {len(summary_df)} repositories (all clean)")
@@ -207,7 +430,7 @@ class CodeScanningReportGenerator:
         print("📊 Generating repository-focused executive summary...")
         
         # Filter for open alerts
-        open_alerts = self.data[self.data['alert_state'] == 'open'].copy()
+        open_alerts = self.data[self.data['alert_state'] == 'open']  # read-only, no copy needed
         
         print(f"  Debug - Found {len(open_alerts)} open alerts")
         
@@ -222,91 +445,54 @@ class CodeScanningReportGenerator:
             repositories_to_include = open_alerts['repository'].unique().tolist()
             print(f"  Debug - Including {len(repositories_to_include)} repositories with alerts")
         
-        # Group by repository and calculate metrics
-        repo_summary = []
-        
-        for repo in repositories_to_include:
-            repo_alerts = open_alerts[open_alerts['repository'] == repo] if not open_alerts.empty else pd.DataFrame()
-            
-            # Get scanned branch
-            all_repo_alerts = self.data[self.data['repository'] == repo] if not self.data.empty else pd.DataFrame()
-            scanned_branch = 'N/A'
-            
-            if not all_repo_alerts.empty and 'scanned_branch' in all_repo_alerts.columns:
-                branch_values = all_repo_alerts['scanned_branch'].dropna().unique()
-                if len(branch_values) > 0:
-                    scanned_branch = branch_values[0]
-            
-            if scanned_branch == 'N/A' and repo in self.repository_metadata:
-                scanned_branch = self.repository_metadata[repo].get('default_branch', 'N/A')
-            
-            if not repo_alerts.empty:
-                # Map both severity types - use .copy() to avoid SettingWithCopyWarning
-                repo_alerts = repo_alerts.copy()
-                severity_col = None
-                if 'rule_security_severity_level' in repo_alerts.columns:
-                    repo_alerts['combined_severity'] = repo_alerts['rule_security_severity_level'].fillna(
-                        repo_alerts['rule_severity']
-                    ).str.upper()
-                elif 'rule_severity' in repo_alerts.columns:
-                    repo_alerts['combined_severity'] = repo_alerts['rule_severity'].str.upper()
-                
-                severity_counts = repo_alerts['combined_severity'].value_counts() if 'combined_severity' in repo_alerts.columns else {}
-                
-                risk_score = sum(
-                    severity_counts.get(severity, 0) * weight
-                    for severity, weight in self.SEVERITY_WEIGHTS.items()
-                )
-                
-                fixed_alerts = all_repo_alerts[all_repo_alerts['alert_state'] == 'fixed']
-                dismissed_alerts = all_repo_alerts[all_repo_alerts['alert_state'] == 'dismissed']
-                
-                responsible1, responsible2 = self.get_responsible(repo)
-                repo_summary.append({
-                    'Repository Name': repo,
-                    'Scanned Branch': scanned_branch,
-                    'Responsible1': responsible1,
-                    'Responsible2': responsible2,
-                    'Risk Score': risk_score,
-                    'Total Open': len(repo_alerts),
-                    'Critical': severity_counts.get('CRITICAL', 0),
-                    'High': severity_counts.get('HIGH', 0),
-                    'Medium': severity_counts.get('MEDIUM', 0),
-                    'Low': severity_counts.get('LOW', 0),
-                    'Error': severity_counts.get('ERROR', 0),
-                    'Warning': severity_counts.get('WARNING', 0),
-                    'Note': severity_counts.get('NOTE', 0),
-                    'Total All Alerts': len(all_repo_alerts),
-                    'Fixed Alerts': len(fixed_alerts),
-                    'Dismissed Alerts': len(dismissed_alerts)
-                })
-            else:
-                # Repository with no open alerts
-                all_fixed = all_repo_alerts[all_repo_alerts['alert_state'] == 'fixed'] if not all_repo_alerts.empty else pd.DataFrame()
-                all_dismissed = all_repo_alerts[all_repo_alerts['alert_state'] == 'dismissed'] if not all_repo_alerts.empty else pd.DataFrame()
-                
-                responsible1, responsible2 = self.get_responsible(repo)
-                repo_summary.append({
-                    'Repository Name': repo,
-                    'Scanned Branch': scanned_branch,
-                    'Responsible1': responsible1,
-                    'Responsible2': responsible2,
-                    'Risk Score': 0,
-                    'Total Open': 0,
-                    'Critical': 0,
-                    'High': 0,
-                    'Medium': 0,
-                    'Low': 0,
-                    'Error': 0,
-                    'Warning': 0,
-                    'Note': 0,
-                    'Total All Alerts': len(all_repo_alerts),
-                    'Fixed Alerts': len(all_fixed),
-                    'Dismissed Alerts': len(all_dismissed)
-                })
-        
-        # Create DataFrame and sort by risk score
-        summary_df = pd.DataFrame(repo_summary)
+        # Open-alert severity counts per repository in one groupby (no per-repo filtering)
+        severity_counts = (
+            open_alerts.groupby(['repository', 'combined_severity'], observed=True)
+            .size()
+            .unstack(fill_value=0)
+            .reindex(index=repositories_to_include, columns=self.SEVERITY_ORDER, fill_value=0)
+        )
+        risk_scores = severity_counts.to_numpy(dtype=np.int64) @ self.SEVERITY_WEIGHT_VECTOR
+        
+        open_counts = open_alerts['repository'].value_counts().reindex(repositories_to_include, fill_value=0)
+        total_counts = self.data['repository'].value_counts().reindex(repositories_to_include, fill_value=0)
+        state_counts = pd.crosstab(self.data['repository'], self.data['alert_state']).reindex(
+            index=repositories_to_include, columns=['fixed', 'dismissed'], fill_value=0
+        )
+        
+        # Scanned branch: first non-null branch seen for the repository, else repository metadata
+        if 'scanned_branch' in self.data.columns:
+            branch_map = (self.data.dropna(subset=['scanned_branch'])
+                          .drop_duplicates('repository')
+                          .set_index('repository')['scanned_branch']
+                          .to_dict())
+        else:
+            branch_map = {}
+        scanned_branches = [
+            branch_map.get(repo) or self.repository_metadata.get(repo, {}).get('default_branch', 'N/A')
+            for repo in repositories_to_include
+        ]
+        
+        responsibles = [self.get_responsible(repo) for repo in repositories_to_include]
+        
+        repo_summary = {
+            'Repository Name': repositories_to_include,
+            'Scanned Branch': scanned_branches,
+            'Responsible1': [responsible[0] for responsible in responsibles],
+            'Responsible2': [responsible[1] for responsible in responsibles],
+            'Risk Score': risk_scores,
+            'Total Open': open_counts.to_numpy(),
+        }
+        for severity in self.SEVERITY_ORDER:
+            repo_summary[severity.capitalize()] = severity_counts[severity].to_numpy()
+        repo_summary.update({
+            'Total All Alerts': total_counts.to_numpy(),
+            'Fixed Alerts': state_counts['fixed'].to_numpy(),
+            'Dismissed Alerts': state_counts['dismissed'].to_numpy()
+        })
+        
+        # Create DataFrame (columns are already arrays, so no copy) and sort by risk score
+        summary_df = pd.DataFrame(repo_summary, copy=False)
         summary_df = summary_df.sort_values('Risk Score', ascending=False).reset_index(drop=True)
         
         # Add priority ranking
@@ -359,21 +545,20 @@ class CodeScanningReportGenerator:
             'rule_tags': 'Tags'
         }
         
-        # Create detailed report
-        detailed_df = self.data.copy()
-        
-        # Ensure all required columns exist
-        for col in detailed_columns.keys():
-            if col not in detailed_df.columns:
-                detailed_df[col] = 'N/A'
+        # Select and rename columns in one pass; missing columns are added as 'N/A'
+        # (no full copy of the alert data first)
+        detailed_df = self.data.reindex(columns=list(detailed_columns), fill_value='N/A').rename(
+            columns=detailed_columns
+        )
         
-        # Select and rename columns
-        detailed_df = detailed_df[list(detailed_columns.keys())].rename(columns=detailed_columns)
+        # Clean and format data (kept categorical for the filters and counts that follow)
+        detailed_df['Status'] = _upper_categorical(detailed_df['Status'])
+        detailed_df['Security Severity'] = _upper_categorical(detailed_df['Security Severity'], fill_value='N/A')
+        detailed_df['Rule Severity'] = _upper_categorical(detailed_df['Rule Severity'], fill_value='N/A')
         
-        # Clean and format data
-        detailed_df['Status'] = detailed_df['Status'].str.upper()
-        detailed_df['Security Severity'] = detailed_df['Security Severity'].fillna('N/A').str.upper()
-        detailed_df['Rule Severity'] = detailed_df['Rule Severity'].fillna('N/A').str.upper()
+        # Sort by age (numeric Int32 column, oldest first) before any 'N/A' text is filled in
+        detailed_df = detailed_df.sort_values('Age (Days)', ascending=False, na_position='last', kind='stable')
+        detailed_df = detailed_df.reset_index(drop=True)
         
         # Format dates
         date_columns = ['Created At', 'Fixed At', 'Dismissed At']
@@ -381,10 +566,6 @@ class CodeScanningReportGenerator:
             if col in detailed_df.columns:
                 detailed_df[col] = detailed_df[col].fillna('N/A')
         
-        # Sort by severity
-        detailed_df = detailed_df.sort_values('Age (Days)', ascending=False, na_position='last')
-        detailed_df = detailed_df.reset_index(drop=True)
-        
         print(f"✅ Detailed report generated with {len(detailed_df)} alerts")
         return detailed_df
     
@@ -412,20 +593,25 @@ class CodeScanningReportGenerator:
             
             print(f"📁 Creating comprehensive reports in: {reports_dir}")
             
-            # Save CSVs
-            if not repo_executive_df.empty:
-                repo_executive_df.to_csv(reports_dir / "executive_summary.csv", index=False)
-                print("✅ Executive CSV: executive_summary.csv")
-            
-            if not detailed_df.empty:
-                detailed_df.to_csv(reports_dir / "detailed_alerts.csv", index=False)
-                print("✅ Detailed CSV: detailed_alerts.csv")
-            
-            # Save Excel files with formatting
-            try:
-                self._save_excel_reports(repo_executive_df, detailed_df, reports_dir)
-            except Exception as e:
-                print(f"⚠️  Could not create Excel reports: {e}")
+            # Save CSVs in the background while the Excel files are written
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                csv_jobs = []
+                if not repo_executive_df.empty:
+                    csv_jobs.append((executor.submit(repo_executive_df.to_csv, reports_dir / "executive_summary.csv", index=False),
+                                     "✅ Executive CSV: executive_summary.csv"))
+                if not detailed_df.empty:
+                    csv_jobs.append((executor.submit(detailed_df.to_csv, reports_dir / "detailed_alerts.csv", index=False),
+                                     "✅ Detailed CSV: detailed_alerts.csv"))
+                
+                # Save Excel files with formatting
+                try:
+                    self._save_excel_reports(repo_executive_df, detailed_df, reports_dir)
+                except Exception as e:
+                    print(f"⚠️  Could not create Excel reports: {e}")
+                
+                for future, message in csv_jobs:
+                    future.result()
+                    print(message)
             
             # Create README
             self._create_readme(reports_dir, repo_executive_df, detailed_df)
@@ -441,272 +627,170 @@ class CodeScanningReportGenerator:
         """
         Save formatted Excel reports with styling.
         
+        The two workbooks share no state, so they are written on separate threads
+        (zip/zlib compression and file I/O release the GIL).
+        
         Args:
             repo_executive_df: Repository executive summary DataFrame
             detailed_df: Detailed alerts DataFrame
             output_dir: Output directory path
         """
-        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            jobs = []
+            if not repo_executive_df.empty:
+                jobs.append((executor.submit(self._write_executive_excel, repo_executive_df, output_dir),
+                             "✅ Executive Excel: executive_summary.xlsx"))
+            if not detailed_df.empty:
+                jobs.append((executor.submit(self._write_detailed_excel, detailed_df, output_dir),
+                             "✅ Detailed Excel: detailed_alerts.xlsx"))
+            
+            for future, message in jobs:
+                future.result()
+                print(message)
+    
+    def _write_executive_excel(self, repo_executive_df: pd.DataFrame, output_dir: Path):
+        """Write executive_summary.xlsx with severity count and repository status colouring."""
+        styles = _excel_styles()
+        cell_styles = {}
+        try:
+            # Severity count columns are coloured when non-zero
+            for col, style in styles['executive_counts'].items():
+                if col in repo_executive_df.columns:
+                    values = repo_executive_df[col].to_numpy()
+                    cell_styles[col] = [style if val and val != 0 else None for val in values]
+            
+            # Repository Name cell - Green (92D050) if no open alerts, Yellow (FFFF00) if has alerts
+            if 'Total Open' in repo_executive_df.columns and 'Repository Name' in repo_executive_df.columns:
+                cell_styles['Repository Name'] = [
+                    styles['repo_clean'] if open_val == 0
+                    else styles['repo_alerts'] if open_val and open_val > 0
+                    else None
+                    for open_val in repo_executive_df['Total Open'].to_numpy()
+                ]
+        except Exception as e:
+            print(f"⚠️  Severity color coding error: {e}")
+        
+        self._write_styled_sheet(output_dir / "executive_summary.xlsx", repo_executive_df, 'Executive Summary', cell_styles)
+    
+    def _write_detailed_excel(self, detailed_df: pd.DataFrame, output_dir: Path):
+        """Write detailed_alerts.xlsx with severity and status colouring."""
+        styles = _excel_styles()
+        cell_styles = {}
+        try:
+            # Severity and status cells are coloured by their (upper-cased) value
+            for col, lookup in (('Security Severity', styles['severity']),
+                                ('Rule Severity', styles['severity']),
+                                ('Status', styles['status'])):
+                if col in detailed_df.columns:
+                    cell_styles[col] = [lookup.get(str(value).upper()) for value in detailed_df[col].to_numpy()]
+        except Exception as e:
+            print(f"⚠️  Detailed severity color coding error: {e}")
+        
+        self._write_styled_sheet(output_dir / "detailed_alerts.xlsx", detailed_df, 'Detailed Alerts', cell_styles)
+    
+    def _write_styled_sheet(self, filename: Path, df: pd.DataFrame, sheet_name: str, cell_styles: Dict[str, List]):
+        """
+        Write a DataFrame to a single-sheet workbook with the shared report styling.
+        
+        The workbook is written in openpyxl's write-only mode: rows are streamed to
+        disk with their final styles instead of building the whole sheet in memory
+        and restyling it afterwards.
+        
+        Args:
+            filename: Target .xlsx path
+            df: Data to write
+            sheet_name: Target sheet name
+            cell_styles: Column name -> one (fill, font) pair or None per data row
+        """
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.utils import get_column_letter
         
-        # Save Executive Summary Excel
-        if not repo_executive_df.empty:
-            exec_filename = output_dir / "executive_summary.xlsx"
-            with pd.ExcelWriter(exec_filename, engine='openpyxl') as writer:
-                repo_executive_df.to_excel(writer, sheet_name='Executive Summary', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Executive Summary']
-                
-                # Define styles
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF", size=11)
-                
-                # Style header row
-                for cell in worksheet[1]:
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = get_column_letter(column[0].column)
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Add borders
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                
-                for row in worksheet.iter_rows(min_row=1, max_row=worksheet.max_row, 
-                                              min_col=1, max_col=worksheet.max_column):
-                    for cell in row:
-                        cell.border = thin_border
-                
-                # Apply severity-based color coding (matching security_report_generator.py)
-                try:
-                    # Create column mapping
-                    col_map = {col: idx+1 for idx, col in enumerate(repo_executive_df.columns)}
-                    
-                    for row in range(2, len(repo_executive_df)+2):
-                        # Critical column - Purple (B1A0C7)
-                        if 'Critical' in col_map:
-                            val = worksheet.cell(row=row, column=col_map['Critical']).value
-                            if val and val != 0:
-                                worksheet.cell(row=row, column=col_map['Critical']).fill = PatternFill(
-                                    start_color='B1A0C7', end_color='B1A0C7', fill_type='solid')
-                        
-                        # High column - Red (FF0000)
-                        if 'High' in col_map:
-                            val = worksheet.cell(row=row, column=col_map['High']).value
-                            if val and val != 0:
-                                worksheet.cell(row=row, column=col_map['High']).fill = PatternFill(
-                                    start_color='FF0000', end_color='FF0000', fill_type='solid')
-                                worksheet.cell(row=row, column=col_map['High']).font = Font(color='FFFFFF', bold=True)
-                        
-                        # Medium column - Orange (F79646)
-                        if 'Medium' in col_map:
-                            val = worksheet.cell(row=row, column=col_map['Medium']).value
-                            if val and val != 0:
-                                worksheet.cell(row=row, column=col_map['Medium']).fill = PatternFill(
-                                    start_color='F79646', end_color='F79646', fill_type='solid')
-                        
-                        # Low column - Light Blue (DAEEF3)
-                        if 'Low' in col_map:
-                            val = worksheet.cell(row=row, column=col_map['Low']).value
-                            if val and val != 0:
-                                worksheet.cell(row=row, column=col_map['Low']).fill = PatternFill(
-                                    start_color='DAEEF3', end_color='DAEEF3', fill_type='solid')
-                        
-                        # Repository Name cell - Green (92D050) if no open alerts, Yellow (FFFF00) if has alerts
-                        if 'Total Open' in col_map and 'Repository Name' in col_map:
-                            open_val = worksheet.cell(row=row, column=col_map['Total Open']).value
-                            repo_cell = worksheet.cell(row=row, column=col_map['Repository Name'])
-                            if open_val == 0:
-                                repo_cell.fill = PatternFill(start_color='92D050', end_color='92D050', fill_type='solid')
-                            elif open_val and open_val > 0:
-                                repo_cell.fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-                
-                except Exception as e:
-                    print(f"⚠️  Severity color coding error: {e}")
-                
-                # Freeze top row
-                worksheet.freeze_panes = 'A2'
-            
-            print("✅ Executive Excel: executive_summary.xlsx")
+        styles = _excel_styles()
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+        
+        # Column widths and the frozen header row must be set before rows are streamed
+        for col_idx, width in enumerate(self._column_widths(df), 1):
+            worksheet.column_dimensions[get_column_letter(col_idx)].width = width
+        worksheet.freeze_panes = 'A2'
+        
+        # Header row
+        header = []
+        for col in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(col))
+            cell.fill = styles['header_fill']
+            cell.font = styles['header_font']
+            cell.alignment = styles['header_alignment']
+            cell.border = styles['border']
+            header.append(cell)
+        worksheet.append(header)
+        
+        # Data rows: bordered cells, coloured where cell_styles says so. Values and styles
+        # are resolved per column up front and zipped row-wise, so the per-cell loop does
+        # no column lookups
+        border = styles['border']
+        column_values = [df[col].to_numpy(dtype=object) for col in df.columns]
+        column_styles = [cell_styles.get(col) or repeat(None) for col in df.columns]
+        for row, row_styles in zip(zip(*column_values), zip(*column_styles)):
+            cells = []
+            for value, style in zip(row, row_styles):
+                cell = WriteOnlyCell(worksheet, value=_excel_value(value))
+                cell.border = border
+                if style:
+                    fill, font = style
+                    cell.fill = fill
+                    if font is not None:
+                        cell.font = font
+                cells.append(cell)
+            worksheet.append(cells)
+        
+        workbook.save(filename)
+    
+    @staticmethod
+    def _column_widths(df: pd.DataFrame) -> List[int]:
+        """
+        Excel column widths: longest rendered value (header included) plus padding, capped at 50.
         
-        # Save Detailed Alerts Excel
-        if not detailed_df.empty:
-            detailed_filename = output_dir / "detailed_alerts.xlsx"
-            with pd.ExcelWriter(detailed_filename, engine='openpyxl') as writer:
-                detailed_df.to_excel(writer, sheet_name='Detailed Alerts', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Detailed Alerts']
-                
-                # Define styles
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                header_font = Font(bold=True, color="FFFFFF", size=11)
-                
-                # Style header row
-                for cell in worksheet[1]:
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = get_column_letter(column[0].column)
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Add borders
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                
-                for row in worksheet.iter_rows(min_row=1, max_row=worksheet.max_row, 
-                                              min_col=1, max_col=worksheet.max_column):
-                    for cell in row:
-                        cell.border = thin_border
-                
-                # Apply severity-based color coding for detailed alerts
-                try:
-                    # Severity color scheme matching security_report_generator.py
-                    severity_colors = {
-                        'CRITICAL': {'bg': 'B1A0C7', 'font': '000000'},
-                        'HIGH': {'bg': 'FF0000', 'font': 'FFFFFF'},
-                        'MEDIUM': {'bg': 'F79646', 'font': '000000'},
-                        'LOW': {'bg': 'DAEEF3', 'font': '000000'},
-                        'ERROR': {'bg': 'FF0000', 'font': 'FFFFFF'},
-                        'WARNING': {'bg': 'F79646', 'font': '000000'},
-                        'NOTE': {'bg': 'DAEEF3', 'font': '000000'}
-                    }
-                    
-                    # Status color scheme
-                    status_colors = {
-                        'OPEN': {'bg': 'FFFF00', 'font': '000000'},
-                        'FIXED': {'bg': '92D050', 'font': '000000'},
-                        'DISMISSED': {'bg': 'D3D3D3', 'font': '000000'}
-                    }
-                    
-                    # Create column mapping
-                    col_map = {col: idx+1 for idx, col in enumerate(detailed_df.columns)}
-                    
-                    for row in range(2, len(detailed_df)+2):
-                        # Color code Security Severity column
-                        if 'Security Severity' in col_map:
-                            severity_cell = worksheet.cell(row=row, column=col_map['Security Severity'])
-                            if severity_cell.value:
-                                severity = str(severity_cell.value).upper()
-                                if severity in severity_colors:
-                                    colors = severity_colors[severity]
-                                    severity_cell.fill = PatternFill(
-                                        start_color=colors['bg'], end_color=colors['bg'], fill_type='solid')
-                                    severity_cell.font = Font(color=colors['font'], bold=True)
-                        
-                        # Color code Rule Severity column
-                        if 'Rule Severity' in col_map:
-                            rule_severity_cell = worksheet.cell(row=row, column=col_map['Rule Severity'])
-                            if rule_severity_cell.value:
-                                severity = str(rule_severity_cell.value).upper()
-                                if severity in severity_colors:
-                                    colors = severity_colors[severity]
-                                    rule_severity_cell.fill = PatternFill(
-                                        start_color=colors['bg'], end_color=colors['bg'], fill_type='solid')
-                                    rule_severity_cell.font = Font(color=colors['font'], bold=True)
-                        
-                        # Color code Status column
-                        if 'Status' in col_map:
-                            status_cell = worksheet.cell(row=row, column=col_map['Status'])
-                            if status_cell.value:
-                                status = str(status_cell.value).upper()
-                                if status in status_colors:
-                                    colors = status_colors[status]
-                                    status_cell.fill = PatternFill(
-                                        start_color=colors['bg'], end_color=colors['bg'], fill_type='solid')
-                                    status_cell.font = Font(color=colors['font'], bold=True)
-                
-                except Exception as e:
-                    print(f"⚠️  Detailed severity color coding error: {e}")
-                
-                # Freeze top row
-                worksheet.freeze_panes = 'A2'
-            
-            print("✅ Detailed Excel: detailed_alerts.xlsx")
+        Missing values count as len('None'), i.e. str() of an empty cell's value.
+        """
+        widths = []
+        for col in df.columns:
+            values = df[col]
+            lengths = values.astype(str).str.len().mask(values.isna(), 4)
+            max_length = max(len(str(col)), int(lengths.max()) if len(lengths) else 0)
+            widths.append(min(max_length + 2, 50))
+        return widths
     
     def _create_readme(self, output_dir: Path, repo_df: pd.DataFrame, detailed_df: pd.DataFrame):
         """Create README file for the reports."""
-        readme_content = f"""# Code Scanning Security Report
-        
-Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-Scope: {self.active_scope if self.active_scope else "All Repositories"}
-
-## Summary
-
-- **Total Repositories Scanned:** {self.stats.get('repositories_scanned', 0)}
-- **Total Alerts Found:** {self.stats.get('total_alerts', 0)}
-- **Open Alerts:** {self.stats.get('open_alerts', 0)}
-- **Fixed Alerts:** {self.stats.get('fixed_alerts', 0)}
-- **Dismissed Alerts:** {self.stats.get('dismissed_alerts', 0)}
-
-## Report Files
-
-### CSV Files (Plain Text)
-1. **executive_summary.csv** - High-level summary by repository
-2. **detailed_alerts.csv** - Complete alert details
-
-### Excel Files (Formatted)
-1. **executive_summary.xlsx** - Formatted executive summary with styling
-2. **detailed_alerts.xlsx** - Formatted detailed alerts with styling
-
-## Severity Breakdown
-
-Open alerts by severity level:
-"""
+        stats = self.stats
+        parts = [README_TEMPLATE.format(
+            generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            scope=self.active_scope if self.active_scope else "All Repositories",
+            repositories=stats.get('repositories_scanned', 0),
+            total=stats.get('total_alerts', 0),
+            open=stats.get('open_alerts', 0),
+            fixed=stats.get('fixed_alerts', 0),
+            dismissed=stats.get('dismissed_alerts', 0),
+        )]
         
         if not detailed_df.empty and 'Security Severity' in detailed_df.columns:
-            open_df = detailed_df[detailed_df['Status'] == 'OPEN']
-            if not open_df.empty:
-                severity_counts = open_df['Security Severity'].value_counts()
-                for severity, count in severity_counts.items():
-                    readme_content += f"- {severity}: {count}\n"
+            # Count severities of open rows without materializing the filtered frame; counted as
+            # plain values so unused categories are skipped and ties keep first-seen order
+            open_severities = detailed_df.loc[detailed_df['Status'] == 'OPEN', 'Security Severity']
+            severity_counts = open_severities.astype(object).value_counts()
+            parts.append("".join(f"- {severity}: {count}\n" for severity, count in severity_counts.items()))
         
-        readme_content += "\n## Top Repositories by Risk\n\n"
+        parts.append("\n## Top Repositories by Risk\n\n")
         if not repo_df.empty:
-            top_repos = repo_df.head(5)
-            for _, row in top_repos.iterrows():
-                readme_content += f"{row['Priority Rank']}. {row['Repository Name']} (Risk Score: {row['Risk Score']}, Open Alerts: {row['Total Open']})\n"
+            top_repos = repo_df.head(5)[['Priority Rank', 'Repository Name', 'Risk Score', 'Total Open']]
+            parts.append("".join(
+                f"{rank}. {repo} (Risk Score: {risk}, Open Alerts: {open_count})\n"
+                for rank, repo, risk, open_count in top_repos.itertuples(index=False, name=None)
+            ))
         
-        with open(output_dir / "README.md", 'w') as f:
-            f.write(readme_content)
+        (output_dir / "README.md").write_text(''.join(parts), encoding='utf-8')
         
         print("✅ README: README.md")
 
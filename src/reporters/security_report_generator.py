@@ -126,6 +126,19 @@ class SecurityReportGenerator:
         'dismissed': {'bg': 'D3D3D3', 'font': '000000'} # Light Gray
     }
     
+    # Leading characters Excel interprets as the start of a formula
+    FORMULA_PREFIXES = ('=', '+', '-', '@')
+    
+    # Free-text columns that may carry formula-like values and need escaping before Excel export
+    ESCAPE_COLUMNS = frozenset((
+        # Detailed report
+        'Repository Name', 'Scanned Branch', 'Detailed Status', 'Vulnerability Title', 'Component',
+        'Existing Version', 'Vulnerable Versions', 'Patched Version', 'Detected In', 'Resolution Method',
+        'Dismissed By', 'Dismissal Reason', 'CVSS Vector', 'CVE ID', 'GHSA ID', 'Alert URL', 'Description',
+        # Executive, KPI and dashboard summaries
+        'Responsible1', 'Responsible2', 'Metric', 'Value', 'Details'
+    ))
+    
     def __init__(self, scoped_repositories: Optional[List[str]] = None, active_scope: Optional[str] = None):
         """
         Initialize the enhanced report generator.
@@ -705,34 +718,40 @@ class SecurityReportGenerator:
     def _generate_recommendations(self) -> List[Dict]:
         """Generate intelligent recommendations based on vulnerability analysis."""
         recommendations = []
+        critical_open = self.stats['critical_open']
+        high_open = self.stats['high_open']
+        resolution_rate = self.stats['resolution_rate']
+        analytics = self.analytics or {}
+        stale_count = analytics.get('aging_analysis', {}).get('stale_vulnerabilities', 0)
+        max_vulns = analytics.get('repository_analysis', {}).get('max_vulns_in_single_repo', 0)
+        multi_vuln_packages = analytics.get('package_analysis', {}).get('packages_with_multiple_vulns', 0)
         
         # Critical vulnerabilities
-        if self.stats['critical_open'] > 0:
+        if critical_open > 0:
             recommendations.append({
-                'action': f"Address {self.stats['critical_open']} Critical Vulnerabilities",
+                'action': f"Address {critical_open} Critical Vulnerabilities",
                 'reason': "Critical severity requires immediate attention",
                 'priority': 'CRITICAL'
             })
         
         # High vulnerabilities
-        if self.stats['high_open'] > 5:
+        if high_open > 5:
             recommendations.append({
-                'action': f"Prioritize {self.stats['high_open']} High Severity Issues",
+                'action': f"Prioritize {high_open} High Severity Issues",
                 'reason': "Large number of high-severity vulnerabilities",
                 'priority': 'HIGH'
             })
         
         # Resolution rate
-        if self.stats['resolution_rate'] < 70:
+        if resolution_rate < 70:
             recommendations.append({
                 'action': "Improve Vulnerability Resolution Process",
-                'reason': f"Current resolution rate is {self.stats['resolution_rate']}%",
+                'reason': f"Current resolution rate is {resolution_rate}%",
                 'priority': 'MEDIUM'
             })
         
         # Aging vulnerabilities
-        if self.analytics and self.analytics.get('aging_analysis', {}).get('stale_vulnerabilities', 0) > 0:
-            stale_count = self.analytics['aging_analysis']['stale_vulnerabilities']
+        if stale_count > 0:
             recommendations.append({
                 'action': f"Review {stale_count} Stale Vulnerabilities",
                 'reason': "Vulnerabilities older than 180 days need review",
@@ -740,8 +759,7 @@ class SecurityReportGenerator:
             })
         
         # Repository concentration
-        if self.analytics and self.analytics.get('repository_analysis', {}).get('max_vulns_in_single_repo', 0) > 20:
-            max_vulns = self.analytics['repository_analysis']['max_vulns_in_single_repo']
+        if max_vulns > 20:
             recommendations.append({
                 'action': f"Focus on High-Risk Repository",
                 'reason': f"One repository has {max_vulns} vulnerabilities",
@@ -749,8 +767,7 @@ class SecurityReportGenerator:
             })
         
         # Package ecosystem focus
-        if self.analytics and self.analytics.get('package_analysis', {}).get('packages_with_multiple_vulns', 0) > 0:
-            multi_vuln_packages = self.analytics['package_analysis']['packages_with_multiple_vulns']
+        if multi_vuln_packages > 0:
             recommendations.append({
                 'action': "Review Packages with Multiple Vulnerabilities",
                 'reason': f"{multi_vuln_packages} packages have multiple vulnerabilities",
@@ -811,11 +828,22 @@ class SecurityReportGenerator:
         # Select and rename columns
         detailed_df = detailed_df[list(detailed_columns.keys())].rename(columns=detailed_columns)
         
-        # Clean and format data
-        detailed_df['Status'] = detailed_df['Status'].str.upper()
-        detailed_df['Severity'] = detailed_df['Severity'].str.upper()
-        detailed_df['CVSS Score'] = pd.to_numeric(detailed_df['CVSS Score'], errors='coerce').fillna(0.0)
-        
+        # Clean and format data - uppercase the (few) categories rather than every cell
+        for col in ('Status', 'Severity'):
+            categories = detailed_df[col].astype('category')
+            detailed_df[col] = categories.map({c: c.upper() for c in categories.cat.categories if isinstance(c, str)})
+        cvss = detailed_df['CVSS Score']
+        if cvss.dtype.kind in 'fi':
+            # Scanner output is already numeric - skip the object-scan in to_numeric
+            detailed_df['CVSS Score'] = cvss.astype('float64').fillna(0.0)
+        else:
+            detailed_df['CVSS Score'] = pd.to_numeric(cvss, errors='coerce').fillna(0.0)
+
+        # Day counts are whole numbers (or missing); store them compactly before Excel serialization
+        for col in ('Days to Resolution', 'Age (Days)'):
+            if detailed_df[col].dtype.kind in 'fi':
+                detailed_df[col] = detailed_df[col].astype('Int32')
+
         # Format dates - these are already formatted by the scanner
         date_columns = ['Detected On', 'Fixed On', 'Dismissed On']
         for col in date_columns:
@@ -825,34 +853,17 @@ class SecurityReportGenerator:
         
         # Sort by severity and CVSS score
         severity_order = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
-        detailed_df['severity_rank'] = detailed_df['Severity'].map({s: i for i, s in enumerate(severity_order)})
-        detailed_df = detailed_df.sort_values(['severity_rank', 'CVSS Score'], ascending=[True, False])
-        detailed_df = detailed_df.drop('severity_rank', axis=1).reset_index(drop=True)
+        severity = detailed_df['Severity'].astype('category')
+        extra_severities = [c for c in severity.cat.categories if c not in severity_order]
+        detailed_df['Severity'] = severity.cat.set_categories(severity_order + extra_severities, ordered=True)
+        detailed_df = detailed_df.sort_values(['Severity', 'CVSS Score'], ascending=[True, False]).reset_index(drop=True)
         
         print(f"✅ Detailed report generated with {len(detailed_df)} vulnerabilities")
         return detailed_df
     
-    def _escape_excel_formulas(self, value) -> str:
-        """
-        Escape potential Excel formulas to prevent security warnings.
-        
-        Args:
-            value: Value to escape
-            
-        Returns:
-            Escaped value safe for Excel
-        """
-        if pd.isna(value):
-            return value
-        
-        str_value = str(value)
-        if str_value.startswith(('=', '+', '-', '@')):
-            return "'" + str_value
-        return str_value
-    
     def _escape_dataframe_formulas(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Apply Excel formula escaping to all string columns in a DataFrame.
+        Apply Excel formula escaping to the free-text columns of a DataFrame.
         
         Args:
             df: DataFrame to escape
@@ -865,8 +876,15 @@ class SecurityReportGenerator:
         
         df_copy = df.copy()
         for col in df_copy.columns:
-            if df_copy[col].dtype == 'object':  # String columns
-                df_copy[col] = df_copy[col].apply(self._escape_excel_formulas)
+            if col not in self.ESCAPE_COLUMNS:
+                continue
+            values = df_copy[col]
+            if not pd.api.types.is_string_dtype(values.dtype):
+                continue
+            mask = values.str.startswith(self.FORMULA_PREFIXES, na=False)
+            if not mask.any():
+                continue  # Common case - nothing to escape, skip the write-back
+            df_copy[col] = values.mask(mask, "'" + values[mask])
         return df_copy
     
     def _apply_excel_formatting(self, worksheet, dataframe: pd.DataFrame, report_type: str):
@@ -879,7 +897,7 @@ class SecurityReportGenerator:
             report_type: 'executive', 'enhanced', 'detailed', or 'dashboard'
         """
         try:
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
             from openpyxl.utils import get_column_letter
             from openpyxl.formatting.rule import CellIsRule, ColorScaleRule
         except ImportError as e:
@@ -897,15 +915,6 @@ class SecurityReportGenerator:
             
             scheme = color_schemes.get(report_type, color_schemes['executive'])
             
-            # Header formatting
-            header_font = Font(bold=True, color='FFFFFF', size=12)
-            header_fill = PatternFill(
-                start_color=scheme['header_color'],
-                end_color=scheme['header_color'],
-                fill_type='solid'
-            )
-            header_alignment = Alignment(horizontal='center', vertical='center')
-            
             # Define border style
             thin_border = Border(
                 left=Side(style='thin'),
@@ -914,13 +923,24 @@ class SecurityReportGenerator:
                 bottom=Side(style='thin')
             )
             
+            # Header formatting - registered once per workbook as a named style
+            header_style_name = f'hdr_{report_type}'
+            workbook = worksheet.parent
+            if header_style_name not in workbook.named_styles:
+                header_style = NamedStyle(name=header_style_name)
+                header_style.font = Font(bold=True, color='FFFFFF', size=12)
+                header_style.fill = PatternFill(
+                    start_color=scheme['header_color'],
+                    end_color=scheme['header_color'],
+                    fill_type='solid'
+                )
+                header_style.alignment = Alignment(horizontal='center', vertical='center')
+                header_style.border = thin_border
+                workbook.add_named_style(header_style)
+            
             # Apply header formatting
             for col_num in range(1, len(dataframe.columns) + 1):
-                cell = worksheet.cell(row=1, column=col_num)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-                cell.border = thin_border
+                worksheet.cell(row=1, column=col_num).style = header_style_name
             
             # Enhanced formatting for different report types
             if report_type == 'enhanced':
@@ -1257,10 +1277,11 @@ class SecurityReportGenerator:
                     ws_detailed = writer.sheets['All Vulnerabilities']
                     self._apply_excel_formatting(ws_detailed, safe_detailed_df, 'detailed')
                     
-                    # Add filtered sheets for different severities
-                    for severity in ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']:
-                        severity_vulns = safe_detailed_df[safe_detailed_df['Severity'] == severity] if 'Severity' in safe_detailed_df.columns else pd.DataFrame()
-                        if not severity_vulns.empty:
+                    # Add filtered sheets for different severities (bucketed in a single pass)
+                    severity_groups = dict(list(safe_detailed_df.groupby('Severity', sort=False))) if 'Severity' in safe_detailed_df.columns else {}
+                    for severity in ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW'):
+                        severity_vulns = severity_groups.get(severity)
+                        if severity_vulns is not None and not severity_vulns.empty:
                             severity_vulns.to_excel(writer, sheet_name=f'{severity.title()} Severity', index=False)
                             ws_severity = writer.sheets[f'{severity.title()} Severity']
                             self._apply_excel_formatting(ws_severity, severity_vulns, 'detailed')
@@ -1277,44 +1298,53 @@ class SecurityReportGenerator:
         if not self.stats:
             return []
         
+        s = self.stats
+        total = s.get('total_vulnerabilities', 0)
+        open_ = s.get('open_vulnerabilities', 0)
+        resolution_rate = s.get('resolution_rate', 0)
+        avg_resolution = s.get('average_resolution_days', 0)
+        avg_resolution_status = s.get('average_resolution_days', 999)
+        critical_open = s.get('critical_open', 0)
+        high_open = s.get('high_open', 0)
+        average_cvss = s.get('average_cvss', 0)
+        
         dashboard_data = [
-            {'Metric': 'Total Vulnerabilities', 'Value': self.stats.get('total_vulnerabilities', 0), 'Target': 'Minimize', 'Status': '🔴' if self.stats.get('total_vulnerabilities', 0) > 100 else '🟡' if self.stats.get('total_vulnerabilities', 0) > 50 else '🟢'},
-            {'Metric': 'Open Vulnerabilities', 'Value': self.stats.get('open_vulnerabilities', 0), 'Target': 'Minimize', 'Status': '🔴' if self.stats.get('open_vulnerabilities', 0) > 50 else '🟡' if self.stats.get('open_vulnerabilities', 0) > 20 else '🟢'},
-            {'Metric': 'Resolution Rate (%)', 'Value': f"{self.stats.get('resolution_rate', 0):.1f}%", 'Target': '> 80%', 'Status': '🟢' if self.stats.get('resolution_rate', 0) >= 80 else '🟡' if self.stats.get('resolution_rate', 0) >= 60 else '🔴'},
-            {'Metric': 'Avg Resolution Days', 'Value': self.stats.get('average_resolution_days', 0), 'Target': '< 30 days', 'Status': '🟢' if self.stats.get('average_resolution_days', 999) <= 30 else '🟡' if self.stats.get('average_resolution_days', 999) <= 60 else '🔴'},
-            {'Metric': 'Critical Open', 'Value': self.stats.get('critical_open', 0), 'Target': '0', 'Status': '🟢' if self.stats.get('critical_open', 0) == 0 else '🔴'},
-            {'Metric': 'High Open', 'Value': self.stats.get('high_open', 0), 'Target': '< 5', 'Status': '🟢' if self.stats.get('high_open', 0) < 5 else '🟡' if self.stats.get('high_open', 0) < 10 else '🔴'},
-            {'Metric': 'Repositories Scanned', 'Value': self.stats.get('unique_repositories', 0), 'Target': 'Full Coverage', 'Status': '🟢'},
-            {'Metric': 'Average CVSS Score', 'Value': f"{self.stats.get('average_cvss', 0):.1f}", 'Target': '< 4.0', 'Status': '🟢' if self.stats.get('average_cvss', 0) < 4.0 else '🟡' if self.stats.get('average_cvss', 0) < 7.0 else '🔴'},
+            {'Metric': 'Total Vulnerabilities', 'Value': total, 'Target': 'Minimize', 'Status': '🔴' if total > 100 else '🟡' if total > 50 else '🟢'},
+            {'Metric': 'Open Vulnerabilities', 'Value': open_, 'Target': 'Minimize', 'Status': '🔴' if open_ > 50 else '🟡' if open_ > 20 else '🟢'},
+            {'Metric': 'Resolution Rate (%)', 'Value': f"{resolution_rate:.1f}%", 'Target': '> 80%', 'Status': '🟢' if resolution_rate >= 80 else '🟡' if resolution_rate >= 60 else '🔴'},
+            {'Metric': 'Avg Resolution Days', 'Value': avg_resolution, 'Target': '< 30 days', 'Status': '🟢' if avg_resolution_status <= 30 else '🟡' if avg_resolution_status <= 60 else '🔴'},
+            {'Metric': 'Critical Open', 'Value': critical_open, 'Target': '0', 'Status': '🟢' if critical_open == 0 else '🔴'},
+            {'Metric': 'High Open', 'Value': high_open, 'Target': '< 5', 'Status': '🟢' if high_open < 5 else '🟡' if high_open < 10 else '🔴'},
+            {'Metric': 'Repositories Scanned', 'Value': s.get('unique_repositories', 0), 'Target': 'Full Coverage', 'Status': '🟢'},
+            {'Metric': 'Average CVSS Score', 'Value': f"{average_cvss:.1f}", 'Target': '< 4.0', 'Status': '🟢' if average_cvss < 4.0 else '🟡' if average_cvss < 7.0 else '🔴'},
         ]
         
         return dashboard_data
 
     def _create_readme(self, executive_df: pd.DataFrame, detailed_df: pd.DataFrame, output_dir: Path):
         """Create comprehensive README file."""
-        readme_content = f"""# Security Reports
-Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-
-## 📊 Report Summary
-
-### Security Posture Overview
-- **Total Repositories Analyzed**: {self.stats.get('unique_repositories', 0)}
-- **Total Vulnerabilities Found**: {self.stats.get('total_vulnerabilities', 0)}
-- **Open Vulnerabilities**: {self.stats.get('open_vulnerabilities', 0)}
-- **Resolved Vulnerabilities**: {self.stats.get('resolved_vulnerabilities', 0)}
-- **Resolution Rate**: {self.stats.get('resolution_rate', 0):.1f}%
-- **Average CVSS Score**: {self.stats.get('average_cvss', 0):.1f}
-
-### Files Generated
-- executive_summary.xlsx - Multi-sheet executive workbook
-- detailed_vulnerabilities.xlsx - Complete vulnerability inventory
-- *.csv files - Data exports for analysis
-
-*Generated by Security Vulnerability Scanner v2.1*
-"""
-        
-        with open(output_dir / "README.md", 'w', encoding='utf-8') as f:
-            f.write(readme_content)
+        with open(output_dir / "README.md", 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines([
+                "# Security Reports\n",
+                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                "\n",
+                "## 📊 Report Summary\n",
+                "\n",
+                "### Security Posture Overview\n",
+                f"- **Total Repositories Analyzed**: {self.stats.get('unique_repositories', 0)}\n",
+                f"- **Total Vulnerabilities Found**: {self.stats.get('total_vulnerabilities', 0)}\n",
+                f"- **Open Vulnerabilities**: {self.stats.get('open_vulnerabilities', 0)}\n",
+                f"- **Resolved Vulnerabilities**: {self.stats.get('resolved_vulnerabilities', 0)}\n",
+                f"- **Resolution Rate**: {self.stats.get('resolution_rate', 0):.1f}%\n",
+                f"- **Average CVSS Score**: {self.stats.get('average_cvss', 0):.1f}\n",
+                "\n",
+                "### Files Generated\n",
+                "- executive_summary.xlsx - Multi-sheet executive workbook\n",
+                "- detailed_vulnerabilities.xlsx - Complete vulnerability inventory\n",
+                "- *.csv files - Data exports for analysis\n",
+                "\n",
+                "*Generated by Security Vulnerability Scanner v2.1*\n",
+            ])
 
 
 def main():
@@ -1,8 +1,18 @@
 """
 Scanners module - Contains vulnerability and code scanning implementations.
+
+Scanners are resolved lazily (PEP 562) so importing the package, or locating
+one of its modules, does not pull in PyGithub/requests until a scanner is used.
 """
 
-from .vulnerability_scanner import VulnerabilityScanner
-from .code_scanning_scanner import CodeScanningScanner
+try:
+    from ..utils.lazy_exports import lazy_exports
+except ImportError:  # Imported as a top-level package, with src/ on sys.path
+    from utils.lazy_exports import lazy_exports
 
 __all__ = ['VulnerabilityScanner', 'CodeScanningScanner']
+
+__getattr__ = lazy_exports(__name__, {
+    'VulnerabilityScanner': '.vulnerability_scanner',
+    'CodeScanningScanner': '.code_scanning_scanner',
+})
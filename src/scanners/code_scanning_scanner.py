@@ -21,14 +21,103 @@ Version: 1.0.0
 """
 
 import os
-import json
+import sys
 import csv
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
 import requests
-from github import Github
 from dotenv import load_dotenv
 
+# Shared helpers live in src/utils; put src/ on the path when run as a script
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+from utils.github_session import create_github_session, mount_github_adapter
+from utils.json_utils import json_bytes, json_loads
+
+try:
+    import requests_cache
+except ImportError:  # Optional on-disk HTTP cache; plain requests sessions otherwise
+    requests_cache = None
+
+
+@lru_cache(maxsize=8192)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp (cached: alerts often share creation times)."""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@lru_cache(maxsize=1024)
+def _join_tags(tags: Tuple[str, ...]) -> str:
+    """Comma-join a rule's tags; cached so alerts of the same rule share one string object."""
+    return ','.join(tags)
+
+
+class AlertResultsWriter:
+    """
+    Incrementally writes processed alerts to the temporary JSON and CSV files.
+    
+    Alerts are appended as each repository is scanned, so only the running
+    counters are kept in memory instead of the full alert list.
+    """
+    
+    def __init__(self, json_filename: str, csv_filename: str):
+        """
+        Open the output files.
+        
+        Args:
+            json_filename: Path of the JSON array output
+            csv_filename: Path of the CSV output (created on the first alert)
+        """
+        self.json_filename = json_filename
+        self.csv_filename = csv_filename
+        self.total_alerts = 0
+        self.state_counts = Counter()
+        
+        self._json_file = open(json_filename, 'wb')
+        self._json_file.write(b'[')
+        self._csv_file = None
+        self._csv_writer = None
+    
+    def write(self, alerts: List[Dict]):
+        """Append a batch of alerts (typically one repository's) to both files."""
+        if not alerts:
+            return
+        
+        self._json_file.write(b',\n' if self.total_alerts else b'\n')
+        self._json_file.write(b',\n'.join(json_bytes(alert) for alert in alerts))
+        self.total_alerts += len(alerts)
+        self.state_counts.update(alert.get('alert_state') for alert in alerts)
+        
+        if self._csv_writer is None:
+            self._csv_file = open(self.csv_filename, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=alerts[0].keys())
+            self._csv_writer.writeheader()
+        self._csv_writer.writerows(alerts)
+    
+    def close(self):
+        """Terminate the JSON array and close both files."""
+        if self._json_file is not None:
+            self._json_file.write(b'\n]' if self.total_alerts else b']')
+            self._json_file.close()
+            self._json_file = None
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class CodeScanningScanner:
     """
@@ -53,13 +142,29 @@ class CodeScanningScanner:
         'error': 20
     }
     
-    def __init__(self, github_token: str, base_url: str = None):
+    # Repositories scanned concurrently by scan_organization
+    DEFAULT_MAX_WORKERS = 16
+    
+    # Alert pages requested per call, and pages of one repository fetched concurrently
+    ALERTS_PER_PAGE = 100
+    PAGE_FETCH_WORKERS = 4
+    
+    # Repository listing fields kept in the ETag listing cache
+    LISTING_CACHE_FIELDS = ('name', 'default_branch', 'archived', 'disabled')
+    
+    def __init__(self, github_token: str, base_url: str = None, http_cache: Optional[str] = None,
+                 listing_cache: Optional[str] = None):
         """
         Initialize the code scanning scanner.
         
         Args:
             github_token: GitHub personal access token
             base_url: GitHub base URL (auto-detected from environment)
+            http_cache: Path of an on-disk (SQLite) HTTP response cache; defaults to the
+                GITHUB_HTTP_CACHE environment variable. Requires requests-cache.
+            listing_cache: Path of a JSON file keeping repository listing pages with their
+                ETags, so unchanged pages are revalidated instead of re-downloaded; defaults
+                to the GITHUB_LISTING_CACHE environment variable.
         """
         # Get base URL from environment or use default
         if base_url is None:
@@ -73,14 +178,13 @@ class CodeScanningScanner:
         self.api_base = f"{self.base_url}/api/v3"
         self.github_token = github_token
         
-        # Initialize GitHub client
-        if 'github.com' in self.base_url and self.base_url == 'https://github.com':
-            self.github_client = Github(login_or_token=github_token)
-        else:
-            self.github_client = Github(base_url=f"{self.base_url}/api/v3", login_or_token=github_token)
-        
-        # Configure session for API calls
-        self.session = requests.Session()
+        # Configure session for API calls (pooled so concurrent repository and page fetches reuse connections)
+        self.session = create_github_session(
+            self._create_session(http_cache or os.getenv('GITHUB_HTTP_CACHE')),
+            pool_maxsize=self.DEFAULT_MAX_WORKERS * self.PAGE_FETCH_WORKERS,
+            allowed_methods=('GET',)
+        )
+        self._pool_maxsize = self.DEFAULT_MAX_WORKERS * self.PAGE_FETCH_WORKERS
         self.session.headers.update({
             'Authorization': f'token {github_token}',
             'Accept': 'application/vnd.github.v3+json',
@@ -96,6 +200,50 @@ class CodeScanningScanner:
         
         # Store repository metadata
         self.repository_metadata = {}
+        
+        # Default branch / archived / disabled flags per repository, filled from the repository listing
+        self._repository_info = {}
+        
+        # Guards shared counters updated from concurrent repository scans
+        self._stats_lock = threading.Lock()
+        
+        # ETag-keyed repository listing pages from earlier runs
+        self._listing_cache_path = listing_cache or os.getenv('GITHUB_LISTING_CACHE')
+        self._listing_cache = self._load_listing_cache()
+    
+    @staticmethod
+    def _create_session(http_cache: Optional[str]) -> requests.Session:
+        """
+        Create the API session, backed by an on-disk response cache when one is configured.
+        
+        The cache follows GitHub's Cache-Control headers and revalidates expired
+        entries with their ETag, so unchanged pages come back as 304s that do not
+        count against the rate limit.
+        """
+        if http_cache:
+            if requests_cache is not None:
+                return requests_cache.CachedSession(
+                    http_cache,
+                    backend='sqlite',
+                    cache_control=True,
+                    stale_if_error=True,
+                    allowable_methods=('GET', 'HEAD')
+                )
+            print("ℹ️  requests-cache is not installed; HTTP response cache disabled")
+        return requests.Session()
+    
+    def _size_connection_pool(self, max_workers: int):
+        """
+        Mount an adapter with a connection per possible in-flight request.
+        
+        Each of max_workers repository scans fetches up to PAGE_FETCH_WORKERS
+        pages at once; a smaller pool would open and discard extra connections.
+        """
+        pool_maxsize = max_workers * self.PAGE_FETCH_WORKERS
+        if pool_maxsize <= self._pool_maxsize:
+            return
+        mount_github_adapter(self.session, pool_maxsize, allowed_methods=('GET',))
+        self._pool_maxsize = pool_maxsize
     
     def get_organization_repositories(self, org_name: str) -> List[str]:
         """
@@ -112,42 +260,141 @@ class CodeScanningScanner:
         try:
             # Try as organization first
             try:
-                org = self.github_client.get_organization(org_name)
+                pages = self._get_all_pages(f"{self.api_base}/orgs/{org_name}/repos", {'type': 'all'},
+                                            cache_fields=self.LISTING_CACHE_FIELDS)
                 repos = []
-                page = 1
-                
-                while True:
-                    try:
-                        repo_page = list(org.get_repos(type='all').get_page(page - 1))
-                        if not repo_page:
-                            break
-                        print(f"  Found {len(repo_page)} repositories on page {page}")
-                        repos.extend([repo.name for repo in repo_page])
-                        page += 1
-                    except Exception:
-                        if page == 1:
-                            all_repos = list(org.get_repos(type='all'))
-                            repos.extend([repo.name for repo in all_repos])
-                            print(f"  Found {len(all_repos)} repositories")
-                        break
+                for page, repo_page in enumerate(pages, 1):
+                    print(f"  Found {len(repo_page)} repositories on page {page}")
+                    repos.extend(self._remember_repositories(repo_page))
                 
                 print(f"Total repositories found: {len(repos)} (organization)")
+                self._save_listing_cache()
                 return repos
                 
             except Exception:
                 # Try as user account
                 print(f"  Not an organization, trying as user account...")
-                user = self.github_client.get_user(org_name)
-                all_repos = list(user.get_repos(type='all'))
-                repos = [repo.name for repo in all_repos]
+                pages = self._get_all_pages(f"{self.api_base}/users/{org_name}/repos", {'type': 'all'},
+                                            cache_fields=self.LISTING_CACHE_FIELDS)
+                repos = [name for repo_page in pages for name in self._remember_repositories(repo_page)]
                 print(f"  Found {len(repos)} repositories (user account)")
                 print(f"Total repositories found: {len(repos)}")
+                self._save_listing_cache()
                 return repos
             
         except Exception as e:
             print(f"❌ Error fetching repositories: {e}")
             return []
     
+    def _get_all_pages(self, url: str, params: Dict,
+                       cache_fields: Optional[Tuple[str, ...]] = None) -> List[List[Dict]]:
+        """
+        GET every page of a REST list endpoint.
+        
+        Page 1's Link header names the last page; pages 2..last are then fetched
+        concurrently and returned in page order. A response with a rel="next" but
+        no rel="last" link (cursor pagination) is followed one next link at a time.
+        
+        Args:
+            url: List endpoint URL
+            params: Query parameters (page and per_page are added)
+            cache_fields: When a listing cache is configured, keep these fields of each
+                item with the page's ETag and send If-None-Match on later runs (a 304
+                reuses the cached page and does not count against the rate limit)
+            
+        Returns:
+            List of pages, each the decoded JSON list for that page
+        """
+        use_cache = cache_fields is not None and self._listing_cache_path
+        
+        def fetch(page_url, page_params):
+            cache_key = f"{page_url}?{urlencode(sorted(page_params.items()))}" if page_params else page_url
+            cached = self._listing_cache.get(cache_key) if use_cache else None
+            headers = {'If-None-Match': cached['etag']} if cached else None
+            
+            response = self._get_with_rate_limit_backoff(page_url, params=page_params, headers=headers)
+            if cached and response.status_code == 304:
+                return cached['items'], cached['last_page'], cached.get('next')
+            response.raise_for_status()
+            
+            items, last_page = response.json(), self._last_page_number(response)
+            next_url = response.links.get('next', {}).get('url')
+            if use_cache and response.headers.get('ETag'):
+                items = [{field: item.get(field) for field in cache_fields} for item in items]
+                self._listing_cache[cache_key] = {
+                    'etag': response.headers['ETag'],
+                    'items': items,
+                    'last_page': last_page,
+                    'next': next_url
+                }
+            return items, last_page, next_url
+        
+        def get_page(page):
+            return fetch(url, {**params, 'page': page, 'per_page': 100})
+        
+        first_items, last_page, next_url = get_page(1)
+        pages = [first_items]
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_FETCH_WORKERS, last_page - 1)) as executor:
+                pages.extend(items for items, _, _ in executor.map(get_page, range(2, last_page + 1)))
+        else:
+            # No rel="last" link: the next link carries the query (page number or cursor)
+            while next_url:
+                items, _, next_url = fetch(next_url, None)
+                pages.append(items)
+        return pages
+    
+    def _load_listing_cache(self) -> Dict:
+        """Load the ETag listing cache file, starting empty if it is missing or unreadable."""
+        if not self._listing_cache_path:
+            return {}
+        try:
+            with open(self._listing_cache_path, 'rb') as f:
+                raw = f.read()
+            return json_loads(raw)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_listing_cache(self):
+        """Persist the ETag listing cache file (when one is configured)."""
+        if not self._listing_cache_path:
+            return
+        try:
+            with open(self._listing_cache_path, 'wb') as f:
+                f.write(json_bytes(self._listing_cache))
+        except OSError as e:
+            print(f"  ⚠️  Could not save repository listing cache: {e}")
+    
+    def _remember_repositories(self, repos: List[Dict]) -> List[str]:
+        """Record the listing's default branch / archived / disabled flags and return the repository names."""
+        for repo in repos:
+            self._repository_info[repo['name']] = {
+                'default_branch': repo.get('default_branch'),
+                'archived': repo.get('archived', False),
+                'disabled': repo.get('disabled', False)
+            }
+        return [repo['name'] for repo in repos]
+    
+    def _get_repository_info(self, org_name: str, repo_name: str) -> Dict:
+        """
+        Get a repository's default branch and archived / disabled flags.
+        
+        Uses the organization listing when it has been fetched, otherwise one REST
+        call per repository (cached for later lookups).
+        """
+        info = self._repository_info.get(repo_name)
+        if info is None:
+            response = self._get_with_rate_limit_backoff(f"{self.api_base}/repos/{org_name}/{repo_name}")
+            response.raise_for_status()
+            repo = response.json()
+            info = {
+                'default_branch': repo.get('default_branch'),
+                'archived': repo.get('archived', False),
+                'disabled': repo.get('disabled', False)
+            }
+            self._repository_info[repo_name] = info
+        return info
+    
     def get_repository_code_scanning_alerts(self, org_name: str, repo_name: str) -> List[Dict]:
         """
         Extract all Code Scanning alerts from a repository.
@@ -162,12 +409,11 @@ class CodeScanningScanner:
         url = f"{self.api_base}/repos/{org_name}/{repo_name}/code-scanning/alerts"
         alerts = []
         page = 1
-        repo_obj = None
         default_branch = None
         
         while True:
             try:
-                response = self.session.get(url, params={'page': page, 'per_page': 100})
+                response = self._get_alerts_page(url, page)
                 
                 if response.status_code == 403:
                     print(f"  No access to Code Scanning alerts for {repo_name}")
@@ -175,8 +421,7 @@ class CodeScanningScanner:
                 elif response.status_code == 404:
                     # Repository might not have Code Scanning enabled
                     try:
-                        repo_obj = self.github_client.get_repo(f"{org_name}/{repo_name}")
-                        if repo_obj.archived:
+                        if self._get_repository_info(org_name, repo_name)['archived']:
                             print(f"  Skipping archived repository: {repo_name}")
                         else:
                             print(f"  Code Scanning not enabled for {repo_name}")
@@ -189,51 +434,93 @@ class CodeScanningScanner:
                 
                 page_alerts = response.json()
                 
-                # Get repository object for metadata
-                if repo_obj is None:
-                    try:
-                        repo_obj = self.github_client.get_repo(f"{org_name}/{repo_name}")
-                    except Exception as e:
-                        print(f"  ⚠️  Could not access repository {repo_name}: {e}")
-                
                 # Get default branch
-                if default_branch is None and repo_obj is not None:
+                if default_branch is None:
                     try:
-                        default_branch = repo_obj.default_branch
+                        default_branch = self._get_repository_info(org_name, repo_name)['default_branch']
                         print(f"  📍 Default branch: {default_branch}")
-                        self.repository_metadata[repo_name] = {
-                            'default_branch': default_branch,
-                            'has_alerts': len(page_alerts) > 0
-                        }
                     except Exception as e:
                         print(f"  ⚠️  Could not get default branch: {e}")
                         default_branch = 'unknown'
-                        self.repository_metadata[repo_name] = {
-                            'default_branch': 'unknown',
-                            'has_alerts': len(page_alerts) > 0
-                        }
+                    self.repository_metadata[repo_name] = {
+                        'default_branch': default_branch,
+                        'has_alerts': len(page_alerts) > 0
+                    }
                 
                 if not page_alerts:
                     break
                 
-                # Process each alert
-                for alert in page_alerts:
-                    processed_alert = self._process_code_scanning_alert(
-                        repo_name, alert, default_branch
-                    )
-                    if processed_alert:
-                        alerts.append(processed_alert)
+                alerts.extend(self._process_alert_page(repo_name, page_alerts, default_branch))
+                
+                # Page 1's Link header names the last page: fetch the rest concurrently
+                last_page = self._last_page_number(response)
+                if page == 1 and last_page > 1:
+                    remaining_pages = range(2, last_page + 1)
+                    with ThreadPoolExecutor(max_workers=min(self.PAGE_FETCH_WORKERS, len(remaining_pages))) as executor:
+                        for page_response in executor.map(lambda p: self._get_alerts_page(url, p), remaining_pages):
+                            if page_response.status_code != 200:
+                                print(f"  ⚠️  Error {page_response.status_code} for {repo_name}")
+                                break
+                            alerts.extend(self._process_alert_page(repo_name, page_response.json(), default_branch))
+                    break
                 
+                # No rel="next" link means this was the last page
+                if 'next' not in response.links:
+                    break
                 page += 1
                 
             except Exception as e:
                 print(f"  ❌ Error processing {repo_name}: {e}")
-                self.stats['scan_errors'] += 1
+                with self._stats_lock:
+                    self.stats['scan_errors'] += 1
                 break
         
         return alerts
     
-    def _process_code_scanning_alert(self, repo_name: str, alert: Dict, default_branch: str) -> Optional[Dict]:
+    def _get_alerts_page(self, url: str, page: int) -> requests.Response:
+        """GET one page of a repository's Code Scanning alerts."""
+        return self._get_with_rate_limit_backoff(url, params={'page': page, 'per_page': self.ALERTS_PER_PAGE})
+    
+    @staticmethod
+    def _last_page_number(response: requests.Response) -> int:
+        """Page number of the rel="last" link, or 1 when the response has no such link."""
+        last_url = response.links.get('last', {}).get('url')
+        if not last_url:
+            return 1
+        page = parse_qs(urlparse(last_url).query).get('page')
+        return int(page[0]) if page else 1
+    
+    def _process_alert_page(self, repo_name: str, page_alerts: List[Dict], default_branch: str) -> List[Dict]:
+        """Process one page of raw alerts, dropping any that fail to normalize."""
+        processed = []
+        now = datetime.now(timezone.utc)
+        for alert in page_alerts:
+            processed_alert = self._process_code_scanning_alert(repo_name, alert, default_branch, now)
+            if processed_alert:
+                processed.append(processed_alert)
+        return processed
+    
+    def _get_with_rate_limit_backoff(self, url: str, params: Optional[Dict] = None,
+                                     headers: Optional[Dict] = None) -> requests.Response:
+        """
+        GET a URL, backing off and retrying while GitHub reports a rate limit.
+        
+        The session does the retrying (see utils.github_session): it honors the
+        Retry-After and X-RateLimit-Reset headers when present and falls back to
+        exponential backoff otherwise.
+        
+        Args:
+            url: URL to fetch
+            params: Optional query parameters
+            headers: Optional extra request headers
+            
+        Returns:
+            The final response (which may still be a rate-limit response once retries are exhausted)
+        """
+        return self.session.get(url, params=params, headers=headers)
+    
+    def _process_code_scanning_alert(self, repo_name: str, alert: Dict, default_branch: str,
+                                     now: Optional[datetime] = None) -> Optional[Dict]:
         """
         Process and normalize a Code Scanning alert.
         
@@ -241,6 +528,7 @@ class CodeScanningScanner:
             repo_name: Repository name
             alert: Raw alert data from GitHub API
             default_branch: Default branch name
+            now: Reference time for the alert age (current UTC time if omitted)
             
         Returns:
             Processed alert dictionary
@@ -265,7 +553,7 @@ class CodeScanningScanner:
                 'rule_description': rule.get('description'),
                 'rule_severity': rule.get('severity'),  # error, warning, note
                 'rule_security_severity_level': rule.get('security_severity_level'),  # critical, high, medium, low
-                'rule_tags': ','.join(rule.get('tags', [])),
+                'rule_tags': _join_tags(tuple(rule.get('tags') or ())),
                 
                 # Tool information
                 'tool_name': tool.get('name'),  # e.g., CodeQL
@@ -296,119 +584,296 @@ class CodeScanningScanner:
                 'instance_message': most_recent_instance.get('message', {}).get('text'),
                 
                 # Calculate age
-                'alert_age_days': self._calculate_age_days(alert.get('created_at')),
+                'alert_age_days': self._calculate_age_days(alert.get('created_at'), now),
             }
         except Exception as e:
             print(f"  ⚠️  Error processing alert: {e}")
             return None
     
-    def _calculate_age_days(self, created_at: Optional[str]) -> Optional[int]:
+    def _calculate_age_days(self, created_at: Optional[str], now: Optional[datetime] = None) -> Optional[int]:
         """Calculate age of alert in days."""
         if not created_at:
             return None
         
         try:
-            created = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            now = datetime.now(created.tzinfo)
-            return (now - created).days
-        except:
+            return ((now or datetime.now(timezone.utc)) - _parse_timestamp(created_at)).days
+        except Exception:
             return None
     
-    def scan_organization(self, org_name: str, specific_repos: Optional[List[str]] = None) -> List[Dict]:
+    def scan_organization(self, org_name: str, specific_repos: Optional[List[str]] = None,
+                          max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
         """
         Scan entire organization for Code Scanning alerts.
         
+        Collects everything in memory; use iter_organization_alerts to stream
+        alerts to disk instead.
+        
         Args:
             org_name: Organization name or username to scan
             specific_repos: Optional list of specific repository names to scan
+            max_workers: Number of repositories scanned concurrently
             
         Returns:
             List of all alerts found
         """
+        all_alerts = []
+        for alerts in self.iter_organization_alerts(org_name, specific_repos, max_workers):
+            all_alerts.extend(alerts)
+        return all_alerts
+    
+    def iter_organization_alerts(self, org_name: str, specific_repos: Optional[List[str]] = None,
+                                 max_workers: int = DEFAULT_MAX_WORKERS,
+                                 use_org_endpoint: bool = True,
+                                 on_repository: Optional[Callable[[str, int], None]] = None,
+                                 filter_to_listing: bool = True) -> Iterator[List[Dict]]:
+        """
+        Scan an organization, yielding each repository's Code Scanning alerts.
+        
+        When most of the organization is scanned and the token may read the
+        organization-level alert listing, every repository's alerts come from
+        that one paginated endpoint. Otherwise
+        repositories are fetched concurrently (the work is bound by GitHub API
+        latency). Batches are yielded in repository order either way, so a
+        caller writing them out only holds one repository's alerts at a time.
+        
+        Args:
+            org_name: Organization name or username to scan
+            specific_repos: Optional list of specific repository names to scan
+            max_workers: Number of repositories scanned concurrently
+            use_org_endpoint: Try the organization-level alert listing first when
+                more than half of the organization's repositories are scanned
+            on_repository: Called with each scanned repository's name and alert
+                count, in place of the per-repository progress prints
+            filter_to_listing: Drop specific_repos missing from the repository listing.
+                With False they are all scanned, even when the listing is unavailable;
+                the listing then only marks archived / disabled repositories
+            
+        Yields:
+            List of alerts for each repository that has any
+        """
         print(f"🔍 Starting Code Scanning alert scan for {org_name}")
         print("=" * 70)
         
         # Get all repositories
         all_repositories = self.get_organization_repositories(org_name)
-        if not all_repositories:
-            print("❌ No repositories found or access denied")
-            return []
-        
-        # Filter repositories if specific list provided
         if specific_repos:
-            specific_repos = [repo.strip() for repo in specific_repos if repo.strip()]
-            repositories = [repo for repo in all_repositories if repo in specific_repos]
+            specific_repos = list(dict.fromkeys(repo.strip() for repo in specific_repos if repo.strip()))
+        
+        if specific_repos and not filter_to_listing:
+            # A scope names the repositories to scan: the listing only contributes
+            # archived / disabled flags and its spelling of each name (GitHub
+            # repository names are case-insensitive)
+            listed = {repo.lower(): repo for repo in all_repositories}
+            repositories = list(dict.fromkeys(listed.get(repo.lower(), repo) for repo in specific_repos))
+            print(f"📋 Scanning {len(repositories)} scoped repositories")
+            if not all_repositories:
+                print("   ⚠️  Repository listing unavailable; scanning each repository directly")
+        elif not all_repositories:
+            print("❌ No repositories found or access denied")
+            return
+        elif specific_repos:
+            # Set lookups keep the filtering linear in the number of repositories
+            requested = set(specific_repos)
+            repositories = [repo for repo in all_repositories if repo in requested]
             
             print(f"📋 Repository Filtering:")
             print(f"   Total repositories available: {len(all_repositories)}")
             print(f"   Specific repositories requested: {len(specific_repos)}")
             print(f"   Repositories to scan: {len(repositories)}")
             
-            missing_repos = [repo for repo in specific_repos if repo not in all_repositories]
+            available = set(all_repositories)
+            missing_repos = [repo for repo in specific_repos if repo not in available]
             if missing_repos:
                 print(f"   ⚠️  Repositories not found: {', '.join(missing_repos)}")
             
             if not repositories:
                 print("❌ None of the specified repositories were found")
-                return []
+                return
             
             print(f"   ✅ Scanning repositories: {', '.join(repositories)}")
         else:
             repositories = all_repositories
             print(f"📋 Scanning all {len(repositories)} repositories")
         
-        all_alerts = []
+        # The listing already says which repositories are archived or disabled;
+        # skip them here instead of discovering it through a 404 per repository
+        inactive = {repo for repo in repositories
+                    if self._repository_info.get(repo, {}).get('archived')
+                    or self._repository_info.get(repo, {}).get('disabled')}
+        if inactive:
+            repositories = [repo for repo in repositories if repo not in inactive]
+            print(f"   Skipping {len(inactive)} archived or disabled repositories")
+            if not repositories:
+                print("❌ No active repositories to scan")
+                return
         
-        # Scan each repository
-        for i, repo_name in enumerate(repositories, 1):
-            print(f"[{i}/{len(repositories)}] Processing {repo_name}...")
-            self.stats['repositories_scanned'] += 1
+        total_alerts = 0
+        
+        # The organization-level listing returns every repository's alerts, so it
+        # only pays off when most of the organization is scanned
+        org_alerts = None
+        if use_org_endpoint and all_repositories and len(repositories) * 2 > len(all_repositories):
+            org_alerts = self.get_organization_code_scanning_alerts(org_name, repositories)
+        if org_alerts is not None:
+            results = (org_alerts.get(repo_name, []) for repo_name in repositories)
+        else:
+            results = self._scan_repositories(org_name, repositories, max_workers)
+        
+        # Totals are updated on this thread only
+        for i, (repo_name, alerts) in enumerate(zip(repositories, results), 1):
+            with self._stats_lock:
+                self.stats['repositories_scanned'] += 1
+                if alerts:
+                    self.stats['repositories_with_alerts'] += 1
+                    self.stats['alerts_found'] += len(alerts)
             
-            alerts = self.get_repository_code_scanning_alerts(org_name, repo_name)
+            if on_repository is not None:
+                on_repository(repo_name, len(alerts))
+            else:
+                print(f"[{i}/{len(repositories)}] Processed {repo_name}")
+                print(f"  Found {len(alerts)} Code Scanning alerts" if alerts else "  No Code Scanning alerts found")
             
             if alerts:
-                print(f"  Found {len(alerts)} Code Scanning alerts")
-                all_alerts.extend(alerts)
-                self.stats['repositories_with_alerts'] += 1
-                self.stats['alerts_found'] += len(alerts)
-            else:
-                print(f"  No Code Scanning alerts found")
+                total_alerts += len(alerts)
+                yield alerts
         
-        print(f"✅ Code Scanning scan completed: {len(all_alerts)} alerts found")
-        return all_alerts
+        print(f"✅ Code Scanning scan completed: {total_alerts} alerts found")
+    
+    def _scan_repositories(self, org_name: str, repositories: List[str], max_workers: int) -> Iterator[List[Dict]]:
+        """Fetch each repository's alerts on a bounded pool, yielding them in repository order."""
+        self._size_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(
+                lambda repo: self.get_repository_code_scanning_alerts(org_name, repo),
+                repositories
+            )
     
-    def save_results(self, alerts: List[Dict], timestamp: str) -> Tuple[str, str, str]:
+    def get_organization_code_scanning_alerts(self, org_name: str,
+                                              repositories: Optional[List[str]] = None) -> Optional[Dict[str, List[Dict]]]:
         """
-        Save scan results to JSON and CSV files.
+        Fetch the alerts of every repository from the organization-level listing.
+        
+        One paginated endpoint instead of one or more requests per repository. It
+        needs organization owner or security manager access (and is not available
+        for user accounts), so callers fall back to per-repository scanning on None.
+        
+        Args:
+            org_name: Organization name
+            repositories: Repositories being scanned; those without alerts get
+                repository metadata too, as the per-repository scan gives them
+            
+        Returns:
+            Processed alerts by repository name, or None if the listing is unavailable
+        """
+        try:
+            pages = self._get_all_pages(f"{self.api_base}/orgs/{org_name}/code-scanning/alerts", {})
+        except Exception as e:
+            print(f"ℹ️  Organization-level Code Scanning alerts unavailable ({e}); scanning repositories individually")
+            return None
+        
+        raw_by_repo = {}
+        for page_alerts in pages:
+            for alert in page_alerts:
+                repo_name = (alert.get('repository') or {}).get('name')
+                if repo_name:
+                    raw_by_repo.setdefault(repo_name, []).append(alert)
+        
+        alerts_by_repo = {}
+        for repo_name, raw_alerts in raw_by_repo.items():
+            try:
+                default_branch = self._get_repository_info(org_name, repo_name)['default_branch']
+            except Exception as e:
+                print(f"  ⚠️  Could not get default branch for {repo_name}: {e}")
+                default_branch = 'unknown'
+            self.repository_metadata[repo_name] = {
+                'default_branch': default_branch,
+                'has_alerts': True
+            }
+            alerts_by_repo[repo_name] = self._process_alert_page(repo_name, raw_alerts, default_branch)
+        
+        # The listing has no entries for alert-free repositories; their default
+        # branch is already known from the repository listing
+        for repo_name in repositories or []:
+            if repo_name not in alerts_by_repo:
+                self.repository_metadata[repo_name] = {
+                    'default_branch': self._repository_info.get(repo_name, {}).get('default_branch') or 'unknown',
+                    'has_alerts': False
+                }
+        
+        print(f"📡 Fetched {sum(map(len, alerts_by_repo.values()))} alerts from the organization-level listing")
+        return alerts_by_repo
+    
+    def open_results_writer(self, timestamp: str) -> AlertResultsWriter:
+        """
+        Open an incremental writer for the temporary JSON and CSV result files.
         
         Args:
-            alerts: List of alert data
             timestamp: Timestamp string for file naming
             
         Returns:
-            Tuple of (json_filename, csv_filename, metadata_filename)
+            AlertResultsWriter to append alerts to as repositories are scanned
+        """
+        return AlertResultsWriter(
+            f"temp_code_scanning_{timestamp}.json",
+            f"temp_code_scanning_{timestamp}.csv"
+        )
+    
+    def save_metadata(self, timestamp: str) -> str:
+        """
+        Save collected repository metadata.
+        
+        Args:
+            timestamp: Timestamp string for file naming
+            
+        Returns:
+            Path of the metadata file
         """
-        # Create filenames
-        json_filename = f"temp_code_scanning_{timestamp}.json"
-        csv_filename = f"temp_code_scanning_{timestamp}.csv"
         metadata_filename = f"temp_code_scanning_metadata_{timestamp}.json"
+        with open(metadata_filename, 'wb') as f:
+            f.write(json_bytes(self.repository_metadata, indent=True))
+        return metadata_filename
+    
+    def save_parquet(self, alerts: List[Dict], timestamp: str) -> str:
+        """
+        Save scan results as a single zstd-compressed Parquet file (requires pyarrow).
         
-        # Save JSON
-        with open(json_filename, 'w') as f:
-            json.dump(alerts, f, indent=2, default=str)
+        Args:
+            alerts: List of alert data
+            timestamp: Timestamp string for file naming
+            
+        Returns:
+            Path of the Parquet file
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
         
-        # Save CSV
-        if alerts:
-            with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=alerts[0].keys())
-                writer.writeheader()
-                writer.writerows(alerts)
+        parquet_filename = f"temp_code_scanning_{timestamp}.parquet"
+        pq.write_table(pa.Table.from_pylist(alerts), parquet_filename, compression='zstd')
+        return parquet_filename
+    
+    def save_results(self, alerts: List[Dict], timestamp: str,
+                     output_format: str = 'json') -> Tuple[str, Optional[str], str]:
+        """
+        Save scan results to JSON and CSV files, or to one Parquet file.
+        
+        Args:
+            alerts: List of alert data
+            timestamp: Timestamp string for file naming
+            output_format: 'json' (JSON + CSV) or 'parquet' (columnar, needs pyarrow)
+            
+        Returns:
+            Tuple of (data_filename, csv_filename, metadata_filename); csv_filename is None for Parquet
+        """
+        if output_format == 'parquet':
+            data_filename, csv_filename = self.save_parquet(alerts, timestamp), None
+        else:
+            with self.open_results_writer(timestamp) as writer:
+                writer.write(alerts)
+            data_filename, csv_filename = writer.json_filename, writer.csv_filename
         
-        # Save repository metadata
-        with open(metadata_filename, 'w') as f:
-            json.dump(self.repository_metadata, f, indent=2, default=str)
+        metadata_filename = self.save_metadata(timestamp)
         
-        return json_filename, csv_filename, metadata_filename
+        return data_filename, csv_filename, metadata_filename
     
     def print_statistics(self):
         """Print scan statistics."""
@@ -431,16 +896,21 @@ def main():
     scanner = CodeScanningScanner(github_token)
     org_name = os.getenv('GITHUB_ORG', 'your-organization')
     
-    alerts = scanner.scan_organization(org_name)
+    # Stream each repository's alerts to disk as it is scanned
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    with scanner.open_results_writer(timestamp) as writer:
+        for alerts in scanner.iter_organization_alerts(org_name):
+            writer.write(alerts)
     
-    if alerts:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        json_file, csv_file, metadata_file = scanner.save_results(alerts, timestamp)
+    if writer.total_alerts:
+        metadata_file = scanner.save_metadata(timestamp)
         
         print(f"\n📁 Results saved:")
-        print(f"   JSON: {json_file}")
-        print(f"   CSV: {csv_file}")
+        print(f"   JSON: {writer.json_filename}")
+        print(f"   CSV: {writer.csv_filename}")
         print(f"   Metadata: {metadata_file}")
+    else:
+        os.remove(writer.json_filename)
     
     scanner.print_statistics()
 
@@ -10,6 +10,7 @@ Version: 2.0.0
 """
 
 import os
+import sys
 import json
 import csv
 from datetime import datetime
@@ -18,6 +19,12 @@ import requests
 from github import Github
 from dotenv import load_dotenv
 
+# Shared helpers live in src/utils; put src/ on the path when run as a script
+_src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _src_dir not in sys.path:
+    sys.path.insert(0, _src_dir)
+from utils.json_utils import json_bytes, json_loads
+
 
 class VulnerabilityScanner:
     """
@@ -39,13 +46,18 @@ class VulnerabilityScanner:
         'low': 3.0
     }
     
-    def __init__(self, github_token: str, base_url: str = None):
+    def __init__(self, github_token: str, base_url: str = None, alert_cache: Optional[str] = None):
         """
         Initialize the vulnerability scanner.
         
         Args:
             github_token: GitHub personal access token
             base_url: GitHub base URL (auto-detected from environment)
+            alert_cache: Path of a JSON file keeping Dependabot alert pages with their
+                ETags, so unchanged pages are revalidated instead of re-downloaded;
+                defaults to the GITHUB_ALERT_CACHE environment variable. Only
+                scan_organization writes it back; other callers of
+                get_repository_vulnerabilities call save_alert_cache() when done.
         """
         # Get base URL from environment or use default
         if base_url is None:
@@ -88,6 +100,10 @@ class VulnerabilityScanner:
         
         # Store repository metadata (including default branch) for all scanned repos
         self.repository_metadata = {}
+        
+        # ETag-keyed Dependabot alert pages from earlier runs
+        self._alert_cache_path = alert_cache or os.getenv('GITHUB_ALERT_CACHE')
+        self._alert_cache = self._load_alert_cache()
     
     def get_organization_repositories(self, org_name: str) -> List[str]:
         """
@@ -157,6 +173,10 @@ class VulnerabilityScanner:
             
         Returns:
             List of vulnerability dictionaries
+        
+        Note:
+            Fetched alert pages are added to the in-memory alert cache only; call
+            save_alert_cache() after the last repository (scan_organization does).
         """
         url = f"{self.api_base}/repos/{org_name}/{repo_name}/dependabot/alerts"
         vulnerabilities = []
@@ -166,7 +186,7 @@ class VulnerabilityScanner:
         
         while True:
             try:
-                response = self.session.get(url, params={'page': page, 'per_page': 100})
+                response, alerts = self._get_alert_page(url, page)
                 
                 if response.status_code == 403:
                     print(f"  No access to Dependabot alerts for {repo_name}")
@@ -180,12 +200,10 @@ class VulnerabilityScanner:
                         break
                     except:
                         break
-                elif response.status_code != 200:
+                elif alerts is None:
                     print(f"  ⚠️  Error {response.status_code} for {repo_name}")
                     break
                 
-                alerts = response.json()
-                
                 # Get repository object for version extraction if not already obtained
                 if repo_obj is None:
                     try:
@@ -249,6 +267,53 @@ class VulnerabilityScanner:
         
         return vulnerabilities
     
+    def _get_alert_page(self, url: str, page: int) -> Tuple[requests.Response, Optional[List[Dict]]]:
+        """
+        GET one page of Dependabot alerts.
+        
+        When an alert cache is configured, the page's cached ETag is sent as
+        If-None-Match; a 304 reuses the cached alerts and does not count against
+        the rate limit. New pages are kept in memory until save_alert_cache().
+        
+        Returns:
+            The response and its alerts (None unless the status is 200 or 304)
+        """
+        params = {'page': page, 'per_page': 100}
+        cache_key = f"{url}?page={page}&per_page=100"
+        cached = self._alert_cache.get(cache_key) if self._alert_cache_path else None
+        headers = {'If-None-Match': cached['etag']} if cached else None
+        
+        response = self.session.get(url, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            return response, cached['alerts']
+        if response.status_code != 200:
+            return response, None
+        
+        alerts = response.json()
+        if self._alert_cache_path and response.headers.get('ETag'):
+            self._alert_cache[cache_key] = {'etag': response.headers['ETag'], 'alerts': alerts}
+        return response, alerts
+    
+    def _load_alert_cache(self) -> Dict:
+        """Load the ETag alert cache file, starting empty if it is missing or unreadable."""
+        if not self._alert_cache_path:
+            return {}
+        try:
+            with open(self._alert_cache_path, 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+    
+    def save_alert_cache(self):
+        """Persist the ETag alert cache file (when one is configured)."""
+        if not self._alert_cache_path:
+            return
+        try:
+            with open(self._alert_cache_path, 'wb') as f:
+                f.write(json_bytes(self._alert_cache))
+        except OSError as e:
+            print(f"  ⚠️  Could not save Dependabot alert cache: {e}")
+    
     def _process_vulnerability_alert(self, repo_name: str, alert: Dict) -> Optional[Dict]:
         """
         Process and normalize a Dependabot alert with intelligent CVSS scoring.
@@ -1045,8 +1110,9 @@ class VulnerabilityScanner:
             # Clean up the repository names (remove whitespace)
             specific_repos = [repo.strip() for repo in specific_repos if repo.strip()]
             
-            # Filter to only include specified repositories
-            repositories = [repo for repo in all_repositories if repo in specific_repos]
+            # Filter to only include specified repositories (set lookups keep this linear)
+            requested = set(specific_repos)
+            repositories = [repo for repo in all_repositories if repo in requested]
             
             # Report filtering results
             print(f"📋 Repository Filtering:")
@@ -1055,7 +1121,8 @@ class VulnerabilityScanner:
             print(f"   Repositories to scan: {len(repositories)}")
             
             # Check for requested repositories that weren't found
-            missing_repos = [repo for repo in specific_repos if repo not in all_repositories]
+            available = set(all_repositories)
+            missing_repos = [repo for repo in specific_repos if repo not in available]
             if missing_repos:
                 print(f"   ⚠️  Repositories not found: {', '.join(missing_repos)}")
             
@@ -1085,6 +1152,8 @@ class VulnerabilityScanner:
             else:
                 print(f"  No Dependabot alerts found")
         
+        self.save_alert_cache()
+        
         print(f"✅ Vulnerability scan completed: {len(all_vulnerabilities)} vulnerabilities found")
         return all_vulnerabilities
     
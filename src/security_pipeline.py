@@ -429,10 +429,10 @@ class SecurityPipeline:
                         # Top risk repositories
                         if len(exec_df) > 0:
                             print(f"\n📈 **TOP RISK REPOSITORIES**")
-                            top_repos = exec_df.head(3)
-                            for idx, row in top_repos.iterrows():
-                                risk_emoji = "🚨" if row['Risk Score'] > 100 else "⚠️" if row['Risk Score'] > 50 else "📊"
-                                print(f"   {idx + 1}. {risk_emoji} {row['Repository Name']} (Risk Score: {row['Risk Score']})")
+                            top_repos = exec_df.head(3)[['Repository Name', 'Risk Score']]
+                            for rank, (repo_name, risk_score) in enumerate(top_repos.itertuples(index=False, name=None), 1):
+                                risk_emoji = "🚨" if risk_score > 100 else "⚠️" if risk_score > 50 else "📊"
+                                print(f"   {rank}. {risk_emoji} {repo_name} (Risk Score: {risk_score})")
             except Exception as e:
                 print(f"   Could not load detailed summary: {e}")
         
@@ -3,6 +3,8 @@ Utilities module - Contains shared utility functions and helpers.
 """
 
 from .config_loader import load_config, validate_config
+from .github_env import GitHubEnv, read_github_env
+from .lazy_exports import lazy_exports
 from .logger import setup_logger
 
-__all__ = ['load_config', 'validate_config', 'setup_logger']
+__all__ = ['load_config', 'validate_config', 'GitHubEnv', 'read_github_env', 'lazy_exports', 'setup_logger']
@@ -5,8 +5,33 @@ Handles loading and validating config.json settings.
 
 import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+
+@dataclass(frozen=True)
+class ScanConfig:
+    """The validated ``scan`` section of config.json."""
+    output_dir: str
+    dependabot_output_dir: Optional[str] = None
+    codeql_output_dir: Optional[str] = None
+    active_scope: Optional[str] = None
+    max_workers: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Config:
+    """A validated configuration with scopes normalized to name -> repositories."""
+    scan: ScanConfig
+    scopes: Mapping[str, List[str]]
+    scope_descriptions: Mapping[str, str]
 
 
 def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
@@ -37,10 +62,11 @@ def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
             "Please create config/config.json from config/config.json.sample"
         )
     
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    with open(config_file, 'rb') as f:
+        raw = f.read()
     
-    return config
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see the same error
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def validate_config(config: Dict[str, Any]) -> bool:
@@ -83,12 +109,57 @@ def validate_config(config: Dict[str, Any]) -> bool:
     return True
 
 
-def get_scope_repositories(config: Dict[str, Any], scope_name: str) -> list:
+def parse_config(config: Dict[str, Any]) -> Config:
+    """
+    Validate a configuration dictionary once and return a frozen Config.
+    
+    Both scope formats (dict of name -> repositories, or the legacy list of
+    {"name", "repositories"} entries) are normalized to a read-only mapping,
+    so later scope lookups are plain dictionary access.
+    
+    Args:
+        config: Configuration dictionary to validate
+        
+    Returns:
+        Validated Config
+        
+    Raises:
+        ValueError: If configuration is invalid
+    """
+    validate_config(config)
+    
+    scopes = config['scopes']
+    descriptions = {}
+    if isinstance(scopes, list):
+        normalized = {}
+        for scope in scopes:
+            if not isinstance(scope, dict) or 'name' not in scope or 'repositories' not in scope:
+                raise ValueError(f"Invalid scope entry (needs 'name' and 'repositories'): {scope}")
+            normalized.setdefault(scope['name'], scope['repositories'])
+            if 'description' in scope:
+                descriptions.setdefault(scope['name'], scope['description'])
+        scopes = normalized
+    
+    scan_config = config['scan']
+    return Config(
+        scan=ScanConfig(
+            output_dir=scan_config['output_dir'],
+            dependabot_output_dir=scan_config.get('dependabot_output_dir'),
+            codeql_output_dir=scan_config.get('codeql_output_dir'),
+            active_scope=scan_config.get('active_scope'),
+            max_workers=scan_config.get('max_workers'),
+        ),
+        scopes=MappingProxyType(dict(scopes)),
+        scope_descriptions=MappingProxyType(descriptions),
+    )
+
+
+def get_scope_repositories(config: Any, scope_name: str) -> list:
     """
     Get list of repositories for a given scope.
     
     Args:
-        config: Configuration dictionary
+        config: Configuration dictionary, or a Config from parse_config
         scope_name: Name of scope to retrieve
         
     Returns:
@@ -97,10 +168,10 @@ def get_scope_repositories(config: Dict[str, Any], scope_name: str) -> list:
     Raises:
         ValueError: If scope not found
     """
-    scopes = config['scopes']
+    scopes = config.scopes if isinstance(config, Config) else config['scopes']
     
-    # Handle dict format (new)
-    if isinstance(scopes, dict):
+    # Handle dict format (new, and every parsed Config)
+    if isinstance(scopes, Mapping):
         if scope_name not in scopes:
             raise ValueError(f"Scope '{scope_name}' not found in configuration")
         return scopes[scope_name]
@@ -0,0 +1,34 @@
+"""
+GitHub settings from the environment.
+Read once per module, after .env has been loaded.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class GitHubEnv:
+    """GitHub settings read from the environment once, after .env is loaded."""
+    github_token: Optional[str]
+    org_name: str
+    enterprise_url: Optional[str]
+
+
+def read_github_env(default_org: str, default_enterprise_url: Optional[str] = None) -> GitHubEnv:
+    """
+    Read GITHUB_TOKEN, GITHUB_ORG and GITHUB_ENTERPRISE_URL.
+    
+    Args:
+        default_org: Organization used when GITHUB_ORG is not set
+        default_enterprise_url: URL used when GITHUB_ENTERPRISE_URL is not set
+        
+    Returns:
+        The settings as a frozen GitHubEnv
+    """
+    return GitHubEnv(
+        github_token=os.getenv('GITHUB_TOKEN'),
+        org_name=os.getenv('GITHUB_ORG', default_org),
+        enterprise_url=os.getenv('GITHUB_ENTERPRISE_URL', default_enterprise_url),
+    )
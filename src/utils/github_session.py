@@ -0,0 +1,121 @@
+"""
+HTTP sessions for the GitHub REST and GraphQL APIs.
+One retry policy for transient errors and GitHub's rate-limit responses.
+"""
+
+import time
+from typing import Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry budget for transient errors and rate-limit responses
+MAX_RETRIES = 5
+
+
+class GitHubRetry(Retry):
+    """Retry policy that also waits for GitHub's X-RateLimit-Reset when no Retry-After is sent."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None and response.headers.get('X-RateLimit-Remaining') == '0':
+            reset = response.headers.get('X-RateLimit-Reset', '')
+            if reset.isdigit():
+                return max(0.0, int(reset) - time.time())
+        return retry_after
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """Whether a response is one of GitHub's 403 rate-limit responses (not a permission error)."""
+    return response.status_code == 403 and (
+        'Retry-After' in response.headers or
+        response.headers.get('X-RateLimit-Remaining') == '0'
+    )
+
+
+def _retry_rate_limited(response, *args, **kwargs):
+    """
+    Response hook: wait out a 403 rate-limit response and resend the request.
+
+    urllib3's Retry only honours Retry-After for 413/429/503, and retrying every
+    403 would also retry permission errors, so these are handled here. Honors
+    Retry-After, then X-RateLimit-Reset, and falls back to exponential backoff.
+    """
+    for attempt in range(MAX_RETRIES):
+        if not is_rate_limited(response):
+            break
+
+        reset = response.headers.get('X-RateLimit-Reset', '')
+        if 'Retry-After' in response.headers:
+            delay = float(response.headers['Retry-After'])
+        elif reset.isdigit():
+            delay = max(int(reset) - time.time(), 1)
+        else:
+            delay = 2 ** attempt
+        print(f"  ⏳ Rate limited, retrying in {delay:.0f}s...")
+        time.sleep(delay)
+
+        # Resend through the adapter directly, so this hook does not run again
+        response = response.connection.send(response.request, **kwargs)
+    return response
+
+
+def _wait_below_floor(rate_limit_floor: int):
+    """Response hook factory: sleep until X-RateLimit-Reset once fewer than rate_limit_floor requests remain."""
+    def wait_for_rate_limit(response, *args, **kwargs):
+        remaining = response.headers.get('X-RateLimit-Remaining', '')
+        reset = response.headers.get('X-RateLimit-Reset', '')
+        if remaining.isdigit() and int(remaining) < rate_limit_floor and reset.isdigit():
+            time.sleep(max(0.0, int(reset) - time.time()))
+    return wait_for_rate_limit
+
+
+def mount_github_adapter(session: requests.Session, pool_maxsize: int = 10,
+                         allowed_methods: Sequence[str] = ('GET', 'POST')):
+    """
+    Mount a pooled adapter that retries 429 and 5xx responses with GitHubRetry.
+
+    Args:
+        session: Session to mount the adapter on (http:// and https://)
+        pool_maxsize: Connections kept per host, at least the number of concurrent requests
+        allowed_methods: HTTP methods that may be retried
+    """
+    retry = GitHubRetry(
+        total=MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=list(allowed_methods),
+        raise_on_status=False  # Hand the last response back so callers report the status
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def create_github_session(session: Optional[requests.Session] = None, pool_maxsize: int = 10,
+                          allowed_methods: Sequence[str] = ('GET', 'POST'),
+                          rate_limit_floor: Optional[int] = None) -> requests.Session:
+    """
+    Create (or configure) a keep-alive session with GitHub's retry and rate-limit handling.
+
+    429 and 5xx responses are retried by the adapter; 403 rate-limit responses
+    by a response hook, after Retry-After or X-RateLimit-Reset.
+
+    Args:
+        session: Session to configure, e.g. a requests-cache CachedSession; a plain
+            requests.Session is created when omitted
+        pool_maxsize: Connections kept per host
+        allowed_methods: HTTP methods that may be retried
+        rate_limit_floor: When set, pause until the rate limit resets once fewer
+            requests than this remain, instead of running into 403s
+
+    Returns:
+        The configured session
+    """
+    session = session if session is not None else requests.Session()
+    mount_github_adapter(session, pool_maxsize, allowed_methods)
+    session.hooks['response'].append(_retry_rate_limited)
+    if rate_limit_floor is not None:
+        session.hooks['response'].append(_wait_below_floor(rate_limit_floor))
+    return session
@@ -0,0 +1,29 @@
+"""
+JSON encoding and decoding helpers.
+Use orjson when it is installed and the standard library otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+
+def json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON (compact, or indented by 2), using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode('utf-8')
+
+
+def json_loads(raw: Union[bytes, str]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError), so
+    callers catch the same errors either way.
+    """
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
@@ -0,0 +1,30 @@
+"""
+Lazy package exports (PEP 562).
+Lets a package name its public classes without importing their modules until first use.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+
+def lazy_exports(package_name: str, exports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ that imports exports on first access.
+
+    Args:
+        package_name: The package's __name__
+        exports: Attribute name -> relative module name, e.g. {'Scanner': '.scanner'}
+
+    Returns:
+        A function to assign to the package's __getattr__; resolved values are
+        cached in the package namespace, so each is imported only once
+    """
+    def __getattr__(name):
+        if name in exports:
+            module = importlib.import_module(exports[name], package_name)
+            value = getattr(module, name)
+            setattr(sys.modules[package_name], name, value)
+            return value
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+    return __getattr__
@@ -7,7 +7,26 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+# Formatter and handlers are shared by every logger configured here, so
+# repeated setup_logger calls reuse one open stream per destination instead
+# of opening the same log file again each time.
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_HANDLER_CACHE: Dict[tuple, logging.Handler] = {}
+
+
+def _get_handler(key: tuple, factory) -> logging.Handler:
+    """Return the cached handler for key, creating it on first use."""
+    handler = _HANDLER_CACHE.get(key)
+    if handler is None:
+        handler = factory()
+        handler.setFormatter(_FORMATTER)
+        _HANDLER_CACHE[key] = handler
+    return handler
 
 
 def setup_logger(
@@ -31,29 +50,30 @@ def setup_logger(
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper()))
     
-    # Remove existing handlers
-    logger.handlers.clear()
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    handlers = []
     
     # Console handler
     if console_output:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        stream = sys.stdout
+        handlers.append(_get_handler(('console', stream), lambda: logging.StreamHandler(stream)))
     
     # File handler
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_path = Path(log_file).resolve()
+        if ('file', log_path) not in _HANDLER_CACHE:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(_get_handler(('file', log_path),
+                                     lambda: logging.FileHandler(log_path, encoding='utf-8')))
+    
+    # Replace only handlers installed by an earlier setup_logger call, leaving
+    # any that other code attached to this logger in place
+    managed = set(_HANDLER_CACHE.values())
+    for handler in list(logger.handlers):
+        if handler in managed and handler not in handlers:
+            logger.removeHandler(handler)
+    for handler in handlers:
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
     
     return logger
 
@@ -5,10 +5,16 @@ sys.path.insert(0, str(Path('.') / 'src'))
 
 from reporters.security_report_generator import SecurityReportGenerator
 
-gen = SecurityReportGenerator()
 
-print('Testing get_responsible() for Dependabot reports:')
-print(f'RQA: {gen.get_responsible("RQA")}')
-print(f'tda-backend: {gen.get_responsible("tda-backend")}')
-print(f'MiDAS-Platform: {gen.get_responsible("MiDAS-Platform")}')
-print(f'Model_serving_platform: {gen.get_responsible("Model_serving_platform")}')
+def test_get_responsible():
+    gen = SecurityReportGenerator()
+    
+    print('Testing get_responsible() for Dependabot reports:')
+    for repo in ('RQA', 'tda-backend', 'MiDAS-Platform', 'Model_serving_platform'):
+        responsible = gen.get_responsible(repo)
+        print(f'{repo}: {responsible}')
+        assert isinstance(responsible, tuple) and len(responsible) == 2
+
+
+if __name__ == "__main__":
+    test_get_responsible()
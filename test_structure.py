@@ -3,6 +3,7 @@ Quick Test Script - Verify New Structure
 Tests that the new modular structure works correctly.
 """
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -10,36 +11,84 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
-def test_imports():
-    """Test that all modules can be imported."""
-    print("🧪 Testing Module Imports...\n")
+# Modules checked by check_imports, in report order: (group, label, {module: names})
+IMPORT_CHECKS = [
+    ("scanners", "Scanners", {
+        "scanners.vulnerability_scanner": ["VulnerabilityScanner"],
+        "scanners.code_scanning_scanner": ["CodeScanningScanner"],
+    }),
+    ("reporters", "Reporters", {
+        "reporters.security_report_generator": ["SecurityReportGenerator"],
+        "reporters.code_scanning_report_generator": ["CodeScanningReportGenerator"],
+    }),
+    ("issue managers", "Issue managers", {
+        "issue_managers.github_issue_manager": ["GitHubIssueManager"],
+    }),
+    ("utilities", "Utilities", {
+        "utils.config_loader": ["load_config", "validate_config"],
+        "utils.logger": ["setup_logger"],
+    }),
+    ("pipelines", "Pipelines", {
+        "security_pipeline": ["SecurityPipeline"],
+        "code_scanning_pipeline": ["CodeScanningPipeline"],
+    }),
+]
+
+# Source file of each checked module, relative to src/. Loading from an explicit
+# path skips the sys.path finder walk (one stat per path entry per module).
+MODULE_PATHS = {
+    "scanners.vulnerability_scanner": "scanners/vulnerability_scanner.py",
+    "scanners.code_scanning_scanner": "scanners/code_scanning_scanner.py",
+    "reporters.security_report_generator": "reporters/security_report_generator.py",
+    "reporters.code_scanning_report_generator": "reporters/code_scanning_report_generator.py",
+    "issue_managers.github_issue_manager": "issue_managers/github_issue_manager.py",
+    "utils.config_loader": "utils/config_loader.py",
+    "utils.logger": "utils/logger.py",
+    "security_pipeline": "security_pipeline.py",
+    "code_scanning_pipeline": "code_scanning_pipeline.py",
+}
+
+def load_module(module_name):
+    """Import a checked module straight from its MODULE_PATHS file."""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
     
+    spec = importlib.util.spec_from_file_location(module_name, src_path / MODULE_PATHS[module_name])
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing, so later imports of the module reuse it
+    sys.modules[module_name] = module
     try:
-        print("├── Testing scanners...")
-        from scanners.vulnerability_scanner import VulnerabilityScanner
-        from scanners.code_scanning_scanner import CodeScanningScanner
-        print("│   ✅ Scanners imported successfully")
-        
-        print("├── Testing reporters...")
-        from reporters.security_report_generator import SecurityReportGenerator
-        from reporters.code_scanning_report_generator import CodeScanningReportGenerator
-        print("│   ✅ Reporters imported successfully")
-        
-        print("├── Testing issue managers...")
-        from issue_managers.github_issue_manager import GitHubIssueManager
-        print("│   ✅ Issue managers imported successfully")
-        
-        print("├── Testing utilities...")
-        from utils.config_loader import load_config, validate_config
-        from utils.logger import setup_logger
-        print("│   ✅ Utilities imported successfully")
-        
-        print("└── Testing pipelines...")
-        from security_pipeline import SecurityPipeline
-        from code_scanning_pipeline import CodeScanningPipeline
-        print("    ✅ Pipelines imported successfully")
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+def check_imports(deep=False):
+    """
+    Test that all modules can be found, or with deep=True, imported.
+    
+    The default check only looks for each module's file, so it skips loading
+    pandas, openpyxl and PyGithub.
+    """
+    print("🧪 Testing Module Imports...\n" if deep else "🧪 Locating Modules (--deep imports them)...\n")
+    action = "imported" if deep else "found"
+    
+    try:
+        for i, (group, label, modules) in enumerate(IMPORT_CHECKS):
+            last = i == len(IMPORT_CHECKS) - 1
+            print(f"{'└──' if last else '├──'} Testing {group}...")
+            for module_name, names in modules.items():
+                if deep:
+                    module = load_module(module_name)
+                    for name in names:
+                        if not hasattr(module, name):
+                            raise ImportError(f"cannot import name '{name}' from '{module_name}'")
+                elif not (src_path / MODULE_PATHS[module_name]).is_file():
+                    raise ImportError(f"No module named '{module_name}'")
+            print(f"{'    ' if last else '│   '}✅ {label} {action} successfully")
         
-        print("\n✅ All modules imported successfully!")
+        print(f"\n✅ All modules {action} successfully!")
         print("🎉 New structure is working correctly!\n")
         return True
         
@@ -48,7 +97,7 @@ def test_imports():
         print("⚠️  Some modules may need adjustment\n")
         return False
 
-def test_config():
+def check_config():
     """Test configuration loading."""
     print("🧪 Testing Configuration Loading...\n")
     
@@ -76,6 +125,14 @@ def test_config():
         print(f"\n❌ Configuration test failed: {e}")
         return False
 
+def test_imports():
+    """pytest entry point for check_imports (imports every module)."""
+    assert check_imports(deep=True)
+
+def test_config():
+    """pytest entry point for check_config."""
+    assert check_config()
+
 def main():
     """Run all tests."""
     print("="*60)
@@ -86,10 +143,10 @@ def main():
     results = []
     
     # Test imports
-    results.append(test_imports())
+    results.append(check_imports(deep="--deep" in sys.argv[1:]))
     
     # Test configuration
-    results.append(test_config())
+    results.append(check_config())
     
     # Summary
     print("="*60)